@@ -1,4 +1,6 @@
 """Evaluation metrics for evaluating the performance of the query rewriting model."""
+from functools import lru_cache
+
 import mlflow
 
 from mlflow.metrics.genai import EvaluationExample
@@ -22,16 +24,25 @@ query_rewrite_examples = [
     ),
 ]
 
-query_rewrite_metrics = mlflow.metrics.genai.make_genai_metric(
-    name="query_rewrite_metrics",
-    definition="""The query rewrite metrics for evaluating the performance of the query rewriting model.
-    """,  # noqa: E501
-    grading_prompt="""You are an expert in evaluating query rewriting. Your task is to evaluate the rewritten query based on the ground truth. "
+QUERY_REWRITE_GRADING_PROMPT = (
+    "You are an expert in evaluating query rewriting. Your task is to evaluate the rewritten query based on the ground truth. "
     "Focus on information preservation, clearness, and relevance to the original query. "
     "Score the rewritten query from 1 to 5, where 1 is the worst and 5 is the best. "
-    "Provide a justification for your score, explaining how the rewritten query compares to the ground truth. "
-    """,  # noqa: E501
-    examples=query_rewrite_examples,
-    grading_context_columns=["ground_truth"],
-    include_input=False,
+    "Provide a justification for your score, explaining how the rewritten query compares to the ground truth."
 )
+
+
+@lru_cache(maxsize=1)
+def build_query_rewrite_metric():
+    """Build the query rewrite GenAI metric once and reuse it."""
+    return mlflow.metrics.genai.make_genai_metric(
+        name="query_rewrite_metrics",
+        definition="The query rewrite metrics for evaluating the performance of the query rewriting model.",
+        grading_prompt=QUERY_REWRITE_GRADING_PROMPT,
+        examples=query_rewrite_examples,
+        grading_context_columns=["ground_truth"],
+        include_input=False,
+    )
+
+
+query_rewrite_metrics = build_query_rewrite_metric()
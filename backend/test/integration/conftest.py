@@ -1,12 +1,33 @@
 """Integration tests setup."""
+from datetime import datetime
+from pathlib import Path
+
 import asyncpg
 import pytest
 import pytest_asyncio
 
+from pytest_asyncio import is_async_test
+
 from topix.config.config import Config
 from topix.datatypes.stage import StageEnum
 from topix.setup import load_env_file
 
+INTEGRATION_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]):
+    """Run integration tests on the session event loop shared with the Postgres pool."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item) and item.path.is_relative_to(INTEGRATION_DIR):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def frozen_now() -> datetime:
+    """Fixture to provide a fixed timestamp for test records."""
+    return datetime(2024, 1, 1)
+
 
 @pytest.fixture(scope="session")
 def config(env_file: str) -> Config:
@@ -15,12 +36,27 @@ def config(env_file: str) -> Config:
     return Config.load(stage=StageEnum.TEST)
 
 
-@pytest_asyncio.fixture(scope="function", loop_scope="function")
-async def conn(config: Config):
-    """Fixture to provide a database connection for tests."""
-    # Set up your database URL
-    connection = await asyncpg.connect(config.run.databases.postgres.dsn())
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def pg_pool(config: Config):
+    """Fixture to provide a Postgres connection pool shared by the whole session."""
+    pool = await asyncpg.create_pool(config.run.databases.postgres.dsn(), min_size=1, max_size=8)
     try:
-        yield connection
+        yield pool
     finally:
-        await connection.close()
+        await pool.close()
+
+
+@pytest_asyncio.fixture(scope="function", loop_scope="session")
+async def conn(pg_pool: asyncpg.Pool):
+    """Fixture to provide a database connection for tests.
+
+    Each test runs inside a transaction that is rolled back on teardown, so
+    rows created through this connection never need explicit cleanup.
+    """
+    async with pg_pool.acquire() as connection:
+        transaction = connection.transaction()
+        await transaction.start()
+        try:
+            yield connection
+        finally:
+            await transaction.rollback()
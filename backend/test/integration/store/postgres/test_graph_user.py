@@ -2,22 +2,22 @@
 from datetime import datetime
 
 import pytest
-import pytest_asyncio
 
 from topix.datatypes.graph.graph import Graph
 from topix.datatypes.user import User
-from topix.store.postgres.graph import _dangerous_hard_delete_graph_by_uid, create_graph
+from topix.store.postgres.graph import create_graph, get_graph_by_uid
 from topix.store.postgres.graph_user import (
     add_user_to_graph_by_uid,
+    create_graph_with_owner,
     list_graphs_by_user_uid,
     list_users_by_graph_uid,
 )
-from topix.store.postgres.user import _dangerous_hard_delete_user_by_uid, create_user
+from topix.store.postgres.user import create_user
 from topix.utils.common import gen_uid
 
 
-@pytest_asyncio.fixture(scope="module", loop_scope="module")
-async def user_obj():
+@pytest.fixture(scope="module")
+def user_obj(frozen_now: datetime):
     """Fixture to create a user for testing graph associations."""
     user_uid = gen_uid()
     user = User(
@@ -25,14 +25,14 @@ async def user_obj():
         email=f"{user_uid}@test.com",
         username=user_uid,
         name="GraphUserTest",
-        created_at=datetime.now(),
+        created_at=frozen_now,
         password_hash="hashed_password"
     )
     return user
 
 
-@pytest_asyncio.fixture(scope="module", loop_scope="module")
-async def graph_obj():
+@pytest.fixture(scope="module")
+def graph_obj(frozen_now: datetime):
     """Fixture to create a graph for testing user associations."""
     graph_uid = gen_uid()
     graph = Graph(
@@ -44,13 +44,13 @@ async def graph_obj():
         edges=[],
         format_version=1,
         readonly=False,
-        created_at=datetime.now().isoformat(),
+        created_at=frozen_now.isoformat(),
     )
     return graph
 
 
 @pytest.mark.asyncio
-async def test_graph_user_assoc_and_listing(conn, user_obj, graph_obj):
+async def test_graph_user_assoc_and_listing(conn, user_obj, graph_obj, frozen_now):
     """Test user association with a graph and listing functionalities."""
     await create_user(conn, user_obj)
     await create_graph(conn, graph_obj)
@@ -81,7 +81,7 @@ async def test_graph_user_assoc_and_listing(conn, user_obj, graph_obj):
         email=f"{user2_uid}@test.com",
         username=user2_uid,
         name="SecondUser",
-        created_at=datetime.now(),
+        created_at=frozen_now,
         password_hash="hashed_password"
     )
     await create_user(conn, user2)
@@ -96,7 +96,23 @@ async def test_graph_user_assoc_and_listing(conn, user_obj, graph_obj):
     user2_graph_tuples = [(g.uid, g.label) for g in user2_graphs]
     assert (graph_uid, graph_obj.label) in user2_graph_tuples
 
-    # 7. Clean up: delete user and graph
-    await _dangerous_hard_delete_graph_by_uid(conn, graph_uid)
-    await _dangerous_hard_delete_user_by_uid(conn, user_uid)
-    await _dangerous_hard_delete_user_by_uid(conn, user2_uid)
+
+@pytest.mark.asyncio
+async def test_create_graph_with_owner(conn, user_obj, graph_obj):
+    """Test creating a graph together with its owner association."""
+    await create_user(conn, user_obj)
+
+    created = await create_graph_with_owner(conn, graph_obj, user_obj.uid)
+    assert created.id is not None
+
+    graph_users = await list_users_by_graph_uid(conn, graph_obj.uid)
+    assert graph_users == [(user_obj.uid, "owner")]
+
+
+@pytest.mark.asyncio
+async def test_create_graph_with_owner_rejects_unknown_user(conn, graph_obj):
+    """Test that no graph is created when the owner does not exist."""
+    with pytest.raises(ValueError):
+        await create_graph_with_owner(conn, graph_obj, gen_uid())
+
+    assert await get_graph_by_uid(conn, graph_obj.uid) is None
@@ -15,7 +15,7 @@ from topix.store.user import UserStore
 from topix.utils.common import gen_uid
 
 
-@pytest_asyncio.fixture(scope="module", loop_scope="module")
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
 async def init_collection():
     """Initialize the Qdrant collection for graph tests."""
     await ContentStore.from_config().create_collection(force_recreate=True)
@@ -14,7 +14,7 @@ from topix.store.postgres.pool import create_pool
 
 
 @pytest.mark.asyncio
-async def test_note_revision_store_merges_and_prunes(conn):
+async def test_note_revision_store_merges_and_prunes():
     """Keep only the latest snapshot inside the merge window and prune old rows."""
     pool = await create_pool()
     store = NoteRevisionStore(
@@ -23,6 +23,9 @@ async def test_note_revision_store_merges_and_prunes(conn):
         merge_window=timedelta(hours=6),
     )
     await store.ensure_table()
+    # The store writes through its own pool, so use an autocommit connection from
+    # that pool rather than the rolled-back `conn` fixture to observe its writes.
+    conn = await pool.acquire()
     await conn.execute("DELETE FROM note_revisions WHERE note_id = $1", "note-revision-test")
 
     base_note = Note(
@@ -75,4 +78,5 @@ async def test_note_revision_store_merges_and_prunes(conn):
         assert compute_snapshot_hash(serialize_note_snapshot(fourth_note)) in hashes
     finally:
         await conn.execute("DELETE FROM note_revisions WHERE note_id = $1", base_note.id)
+        await pool.release(conn)
         await pool.close()
@@ -0,0 +1,53 @@
+"""Test cases for the RedisStore rate limit checks under concurrent bursts."""
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from topix.config.config import Config
+from topix.store.redis.store import RedisStore
+
+BURST_SIZE = 10
+LIMIT = 5
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def redis_store(config: Config):
+    """Fixture to provide a RedisStore connected to the test Redis."""
+    store = RedisStore.from_config()
+    try:
+        yield store
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_admits_exactly_limit_under_burst(redis_store: RedisStore):
+    """Concurrent requests must not overshoot the sliding window limit."""
+    user_id = f"test_{uuid.uuid4().hex[:8]}"
+    try:
+        results = await asyncio.gather(*(
+            redis_store.check_rate_limit(user_id, max_requests=LIMIT, window_seconds=60, scope="burst_test")
+            for _ in range(BURST_SIZE)
+        ))
+        assert sum(results) == LIMIT
+    finally:
+        await redis_store.redis.delete(f"rate_limit:burst_test:{user_id}")
+
+
+@pytest.mark.asyncio
+async def test_fixed_window_admits_exactly_limit_under_burst(redis_store: RedisStore):
+    """Concurrent requests must not overshoot the fixed window quota."""
+    user_id = f"test_{uuid.uuid4().hex[:8]}"
+    try:
+        results = await asyncio.gather(*(
+            redis_store.check_fixed_window_quota(user_id, limit=LIMIT, period="day", scope="burst_test")
+            for _ in range(BURST_SIZE)
+        ))
+        assert sum(allowed for allowed, _ in results) == LIMIT
+        assert all(retry_after > 0 for _, retry_after in results)
+    finally:
+        keys = await redis_store.redis.keys(f"quota:burst_test:day:*:{user_id}")
+        if keys:
+            await redis_store.redis.delete(*keys)
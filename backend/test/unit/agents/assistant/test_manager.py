@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+
 from collections.abc import AsyncGenerator
 
 import pytest
 
 from topix.agents.assistant.manager import AssistantManager
+from topix.agents.datatypes.annotations import RefAnnotation
 from topix.agents.datatypes.context import ReasoningContext
-from topix.agents.datatypes.outputs import WebSearchOutput
+from topix.agents.datatypes.outputs import MemorySearchOutput, WebSearchOutput
 from topix.agents.datatypes.reasoning_step import ReasoningStep
 from topix.agents.datatypes.stream import (
     AgentStreamMessage,
@@ -104,6 +107,82 @@ async def test_run_streamed_persists_assistant_message_without_tool_calls(monkey
     assert steps[0].message == "Hello world"
 
 
+@pytest.mark.asyncio
+async def test_run_streamed_settles_user_message_write_on_early_close(monkeypatch: pytest.MonkeyPatch):
+    """A client disconnect should still wait for the user message write and raise its failure."""
+    manager = AssistantManager(plan_agent=object())
+    written = asyncio.Event()
+
+    class FailingSession(RecordingSession):
+        async def add_items(self, items: list[Message | dict]) -> None:
+            await asyncio.sleep(0)
+            written.set()
+            raise RuntimeError("database unavailable")
+
+    async def fake_run_streamed(
+        starting_agent: object,
+        input: object,
+        context: ReasoningContext,
+        max_turns: int = 8,
+        name: str = "raw_message",
+    ) -> AsyncGenerator[AgentStreamMessage, None]:
+        yield AgentStreamMessage(
+            type=StreamingMessageType.STREAM_MESSAGE,
+            tool_id="tool-1",
+            tool_name=name,
+            content=Content(type=ContentType.TOKEN, text="Hello"),
+            is_stop=False,
+        )
+        yield AgentStreamMessage(
+            type=StreamingMessageType.STREAM_MESSAGE,
+            tool_id="tool-1",
+            tool_name=name,
+            content=Content(type=ContentType.TOKEN, text=" world"),
+            is_stop=False,
+        )
+
+    monkeypatch.setattr("topix.agents.assistant.manager.AgentRunner.run_streamed", fake_run_streamed)
+
+    stream = manager.run_streamed(
+        context=ReasoningContext(),
+        query="Say hello",
+        session=FailingSession(),
+    )
+    await anext(stream)
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        await stream.aclose()
+
+    assert written.is_set()
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_store_answer_when_user_message_write_fails(monkeypatch: pytest.MonkeyPatch):
+    """A failed user message write should stop the run before the answer is stored."""
+    manager = AssistantManager(plan_agent=object())
+
+    class FailingUserSession(RecordingSession):
+        async def add_items(self, items: list[Message | dict]) -> None:
+            if any(isinstance(item, Message) and item.role == "user" for item in items):
+                raise RuntimeError("database unavailable")
+            await super().add_items(items)
+
+    async def fake_run(
+        starting_agent: object,
+        input: object,
+        context: ReasoningContext,
+        max_turns: int = 5,
+    ) -> str:
+        return "Hello world"
+
+    monkeypatch.setattr("topix.agents.assistant.manager.AgentRunner.run", fake_run)
+
+    session = FailingUserSession()
+    with pytest.raises(RuntimeError, match="database unavailable"):
+        await manager.run(context=ReasoningContext(), query="Say hello", session=session)
+
+    assert session.items == []
+
+
 @pytest.mark.asyncio
 async def test_run_streamed_flushes_reasoning_step_before_tool_call(monkeypatch: pytest.MonkeyPatch):
     """Buffered assistant text should flush into a step before a tool call is appended."""
@@ -184,3 +263,36 @@ async def test_run_streamed_flushes_reasoning_step_before_tool_call(monkeypatch:
     assert isinstance(steps[2], ReasoningStep)
     assert steps[2].id == "raw-1:1"
     assert steps[2].message == "Inflation slowed."
+
+
+@pytest.mark.asyncio
+async def test_postprocess_answer_expands_refs_across_memory_searches():
+    """Short refs should resolve against every memory search, first match winning."""
+    manager = AssistantManager(plan_agent=object())
+    context = ReasoningContext(memory_search_filter={"graph_uid": "board-1"})
+
+    def memory_call(tool_id: str, refs: list[RefAnnotation]) -> ToolCall:
+        return ToolCall(
+            id=tool_id,
+            name=AgentToolName.MEMORY_SEARCH,
+            output=MemorySearchOutput(references=refs),
+            arguments={"query": "notes"},
+            state=ToolCallState.COMPLETED,
+        )
+
+    context.tool_calls = [
+        memory_call("memory-1", [RefAnnotation(ref_id="abcd1111", ref_type="note")]),
+        memory_call("memory-2", [
+            RefAnnotation(ref_id="abcd2222", ref_type="note"),
+            RefAnnotation(ref_id="efgh3333", ref_type="note", parent_id="doc-1", parent_type="document"),
+        ]),
+    ]
+
+    answer = await manager._postprocess_answer(
+        "See (/note/abcd), (/note/efgh) and (/note/zzzz).",
+        context,
+    )
+
+    assert answer == (
+        "See (/boards/board-1/notes/abcd1111), (/boards/board-1/documents/doc-1) and (/note/zzzz)."
+    )
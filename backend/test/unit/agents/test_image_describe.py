@@ -0,0 +1,10 @@
+"""Tests for the image description inputs."""
+
+from topix.agents.image.describe import ImageDescriptionInput
+
+
+def test_message_from_url_matches_model_dump() -> None:
+    """The prebuilt message should be identical to dumping the validated model."""
+    url = "https://example.com/image.png"
+
+    assert ImageDescriptionInput.message_from_url(url) == ImageDescriptionInput.from_url(url).model_dump()
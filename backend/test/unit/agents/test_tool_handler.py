@@ -1,12 +1,16 @@
 """Tests for tool handler streaming output behavior."""
 
+from types import SimpleNamespace
+
 import pytest
 
 from agents import RunContextWrapper
+from openai.types.responses import ResponseReasoningSummaryTextDeltaEvent, ResponseTextDeltaEvent
 
+from topix.agents import tool_handler
 from topix.agents.datatypes.context import Context
 from topix.agents.datatypes.outputs import CodeInterpreterOutput
-from topix.agents.datatypes.stream import AgentStreamMessage
+from topix.agents.datatypes.stream import AgentStreamMessage, StreamingMessageType
 from topix.agents.datatypes.tool_call import ToolCall
 from topix.agents.datatypes.tools import AgentToolName
 from topix.agents.tool_handler import ToolHandler
@@ -60,6 +64,75 @@ async def test_log_output_keeps_tool_call_for_real_tool():
     assert queued[1].is_stop is True
 
 
+@pytest.mark.asyncio
+async def test_process_llm_streaming_batches_deltas_by_type(monkeypatch):
+    """Consecutive deltas of one type should be merged, and a type change should flush them in order."""
+    monkeypatch.setattr(tool_handler, "STREAM_FLUSH_INTERVAL_SECONDS", 60.0)
+    context = Context()
+    deltas = [
+        ResponseReasoningSummaryTextDeltaEvent.model_construct(delta="thinking "),
+        ResponseReasoningSummaryTextDeltaEvent.model_construct(delta="hard"),
+        ResponseTextDeltaEvent.model_construct(delta="Hello"),
+        ResponseTextDeltaEvent.model_construct(delta=", world"),
+    ]
+
+    async def stream_events():
+        for delta in deltas:
+            yield SimpleNamespace(type="raw_response_event", data=delta)
+
+    await ToolHandler.process_llm_streaming(
+        context,
+        SimpleNamespace(stream_events=stream_events),
+        tool_id="raw-1",
+        tool_name=AgentToolName.RAW_MESSAGE,
+    )
+
+    queued = []
+    while not context._message_queue.empty():
+        queued.append(await context._message_queue.get())
+
+    assert [(msg.type, msg.content.text) for msg in queued] == [
+        (StreamingMessageType.STREAM_REASONING_MESSAGE, "thinking hard"),
+        (StreamingMessageType.STREAM_MESSAGE, "Hello, world"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_llm_streaming_flushes_before_other_events_and_on_error(monkeypatch):
+    """Short text should be sent before a tool call event, and not be lost when the stream fails."""
+    monkeypatch.setattr(tool_handler, "STREAM_FLUSH_INTERVAL_SECONDS", 60.0)
+    context = Context()
+    queued_during_tool_call = []
+
+    async def stream_events():
+        yield SimpleNamespace(
+            type="raw_response_event",
+            data=ResponseTextDeltaEvent.model_construct(delta="Let me search"),
+        )
+        yield SimpleNamespace(type="run_item_stream_event", name="tool_called")
+        queued_during_tool_call.append(context._message_queue.qsize())
+        yield SimpleNamespace(
+            type="raw_response_event",
+            data=ResponseTextDeltaEvent.model_construct(delta="Partial"),
+        )
+        raise RuntimeError("max turns exceeded")
+
+    with pytest.raises(RuntimeError):
+        await ToolHandler.process_llm_streaming(
+            context,
+            SimpleNamespace(stream_events=stream_events),
+            tool_id="raw-1",
+            tool_name=AgentToolName.RAW_MESSAGE,
+        )
+
+    queued = []
+    while not context._message_queue.empty():
+        queued.append(await context._message_queue.get())
+
+    assert queued_during_tool_call == [1]
+    assert [msg.content.text for msg in queued] == ["Let me search", "Partial"]
+
+
 def test_convert_func_to_tool_preserves_is_enabled_callable():
     """Function tool conversion should pass through runtime enable checks."""
 
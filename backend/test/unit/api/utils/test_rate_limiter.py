@@ -7,6 +7,7 @@ import pytest
 
 from fastapi import HTTPException, status
 
+from topix.api.utils.rate_limit.cache import ExhaustedQuotaCache
 from topix.api.utils.rate_limit.dependency import rate_limiter
 from topix.api.utils.rate_limit.policy import (
     BILLING_ENABLED_ENV,
@@ -235,3 +236,41 @@ async def test_rate_limiter_unifies_limits_when_billing_disabled(monkeypatch):
     assert fake_store.fixed_calls[0]["limit"] == MINUTE_BURST_LIMITS["plus"]
     assert fake_store.fixed_calls[1]["limit"] == DAILY_UTC_LIMITS["plus"]
     assert fake_store.fixed_calls[2]["limit"] == MONTHLY_UTC_LIMITS["plus"]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_skips_redis_for_cached_exhausted_quota(monkeypatch):
+    """Should reject from the local cache without Redis calls once a quota is exhausted."""
+    monkeypatch.setenv(BILLING_ENABLED_ENV, "true")
+    fake_store = _FakeRedisStore(day_allowed=False)
+    request = _build_request(fake_store, plan="free")
+    request.app.rate_limit_cache = ExhaustedQuotaCache()
+
+    with pytest.raises(HTTPException):
+        await rate_limiter(request=request, user_id="user-123")
+    assert len(fake_store.fixed_calls) == 2
+
+    with pytest.raises(HTTPException) as exc:
+        await rate_limiter(request=request, user_id="user-123")
+
+    assert len(fake_store.fixed_calls) == 2
+    assert exc.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert "Limit: 10 requests/day" in exc.value.detail
+    assert 1 <= int(exc.value.headers["Retry-After"]) <= 3600
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_cache_ignores_other_users(monkeypatch):
+    """Should only short-circuit the user whose quota is exhausted."""
+    monkeypatch.setenv(BILLING_ENABLED_ENV, "true")
+    fake_store = _FakeRedisStore(minute_allowed=False)
+    request = _build_request(fake_store, plan="free")
+    request.app.rate_limit_cache = ExhaustedQuotaCache()
+
+    with pytest.raises(HTTPException):
+        await rate_limiter(request=request, user_id="user-123")
+
+    fake_store.minute_allowed = True
+    await rate_limiter(request=request, user_id="user-456")
+
+    assert [call["user_id"] for call in fake_store.fixed_calls] == ["user-123", "user-456", "user-456", "user-456"]
@@ -0,0 +1,31 @@
+"""Unit tests for configuration loading."""
+
+import pytest
+
+from topix.config import config as config_module
+from topix.config.config import Config
+from topix.datatypes.stage import StageEnum
+
+
+@pytest.fixture
+def secret_calls(monkeypatch):
+    """Stub the Doppler fetch and record which stages were requested."""
+    calls = []
+
+    def fake_load_secrets(stage):
+        calls.append(stage)
+        return "{}"
+
+    monkeypatch.setattr(config_module, "load_secrets", fake_load_secrets)
+    Config.teardown()
+    yield calls
+    Config.teardown()
+
+
+def test_config_load_is_idempotent_per_stage(secret_calls):
+    """Loading the same stage twice should reuse the instance without refetching secrets."""
+    first = Config.load(stage=StageEnum.TEST)
+    second = Config.load(stage=StageEnum.TEST)
+
+    assert first is second
+    assert secret_calls == [StageEnum.TEST]
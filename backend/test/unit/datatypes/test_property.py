@@ -4,14 +4,14 @@ from enum import IntEnum
 
 import pytest
 
-from pydantic import TypeAdapter, ValidationError
+from pydantic import ValidationError
 
 from topix.agents.datatypes.outputs import WebSearchOutput
 from topix.agents.datatypes.reasoning_step import ReasoningStep
 from topix.agents.datatypes.tool_call import ToolCall
 from topix.agents.datatypes.tools import AgentToolName
 from topix.datatypes.property import (
-    DataProperty,
+    DATA_PROPERTY_ADAPTER,
     IconProperty,
     KeywordProperty,
     MultiKeywordProperty,
@@ -75,8 +75,7 @@ def test_keyword_property_retains_enum_type_metadata():
 
 def test_data_property_discriminates_by_type():
     """Discriminated union should produce the right model from raw data."""
-    adapter = TypeAdapter(DataProperty)
-    parsed = adapter.validate_python({"type": "text", "text": "hello", "searchable": True})
+    parsed = DATA_PROPERTY_ADAPTER.validate_python({"type": "text", "text": "hello", "searchable": True})
 
     assert isinstance(parsed, TextProperty)
     assert parsed.text == "hello"
@@ -85,10 +84,8 @@ def test_data_property_discriminates_by_type():
 
 def test_data_property_rejects_unknown_type():
     """Invalid discriminator values should raise a validation error."""
-    adapter = TypeAdapter(DataProperty)
-
     with pytest.raises(ValidationError):
-        adapter.validate_python({"type": "not_a_property", "value": "nope"})
+        DATA_PROPERTY_ADAPTER.validate_python({"type": "not_a_property", "value": "nope"})
 
 
 def test_reasoning_property_accepts_reasoning_steps_and_tool_calls():
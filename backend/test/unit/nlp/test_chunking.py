@@ -1,14 +1,20 @@
 """Unit tests for the Chunker class."""
+import pytest
 
 from topix.nlp.chunking import Chunker
 
 
+@pytest.fixture(scope="module")
+def default_chunker() -> Chunker:
+    """Fixture to provide a Chunker with default sizes, shared across the module."""
+    return Chunker()
+
+
 class TestChunker:
     """Test suite for Chunker class."""
 
-    def test_basic_chunking(self):
+    def test_basic_chunking(self, default_chunker: Chunker):
         """Test basic chunking functionality with simple markdown."""
-        chunker = Chunker()
         markdowns = [
             {
                 "markdown": "# Title\n\nThis is a paragraph with some content.",
@@ -16,7 +22,7 @@ class TestChunker:
             }
         ]
 
-        chunks = chunker.chunk_markdowns(markdowns)
+        chunks = default_chunker.chunk_markdowns(markdowns)
 
         assert len(chunks) > 0
         assert chunks[0].content is not None
@@ -54,9 +60,8 @@ class TestChunker:
         # Each chunk's token size should not exceed max_chunk_size (approximately)
         # Note: We can't easily verify exact token counts without encoding, but we verify splitting occurred
 
-    def test_title_detection(self):
+    def test_title_detection(self, default_chunker: Chunker):
         """Test that titles are properly detected."""
-        chunker = Chunker()
         markdowns = [
             {
                 "markdown": "# Title 1\n\nSome content here.\n\n## Title 2\n\nMore content.",
@@ -64,7 +69,7 @@ class TestChunker:
             }
         ]
 
-        chunks = chunker.chunk_markdowns(markdowns)
+        chunks = default_chunker.chunk_markdowns(markdowns)
 
         # Should create chunks, and titles should be in the content
         assert len(chunks) > 0
@@ -124,12 +129,11 @@ class TestChunker:
         assert "2" in chunks[0].properties.pages.text
         assert "3" in chunks[0].properties.pages.text
 
-    def test_empty_markdown(self):
+    def test_empty_markdown(self, default_chunker: Chunker):
         """Test chunking with empty markdown input."""
-        chunker = Chunker()
         markdowns = [{"markdown": "", "page": "1"}]
 
-        chunks = chunker.chunk_markdowns(markdowns)
+        chunks = default_chunker.chunk_markdowns(markdowns)
 
         # Should create an empty chunk
         assert isinstance(chunks, list)
@@ -137,12 +141,11 @@ class TestChunker:
         assert chunks[0].content.markdown == ""
         assert chunks[0].properties.pages.text == "1"
 
-    def test_single_line_markdown(self):
+    def test_single_line_markdown(self, default_chunker: Chunker):
         """Test chunking with single line markdown."""
-        chunker = Chunker()
         markdowns = [{"markdown": "Single line of text.", "page": "1"}]
 
-        chunks = chunker.chunk_markdowns(markdowns)
+        chunks = default_chunker.chunk_markdowns(markdowns)
 
         assert len(chunks) == 1
         assert chunks[0].content.markdown == "Single line of text."
@@ -183,9 +186,8 @@ class TestChunker:
             assert chunk.content is not None
             assert chunk.properties.pages is not None
 
-    def test_title_regex_pattern(self):
+    def test_title_regex_pattern(self, default_chunker: Chunker):
         """Test that various title formats are detected correctly."""
-        chunker = Chunker()
         markdowns = [
             {
                 "markdown": (
@@ -203,7 +205,7 @@ class TestChunker:
             }
         ]
 
-        lines = chunker._extract_lines_with_metadata(markdowns)
+        lines = default_chunker._extract_lines_with_metadata(markdowns)
 
         # Check title detection
         title_lines = [line for line in lines if line.is_title]
@@ -0,0 +1,65 @@
+"""Tests for the async TTL cache."""
+
+import asyncio
+
+import pytest
+
+from topix.utils.cache import AsyncTTLCache
+
+
+@pytest.mark.asyncio
+async def test_get_or_run_coalesces_caches_and_copies():
+    """Concurrent identical calls should share one run, later ones hit the cache, and results are copies."""
+    cache: AsyncTTLCache[list[str]] = AsyncTTLCache(ttl_seconds=60, max_entries=8, copy=list)
+    calls = 0
+
+    async def search():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return ["https://example.com/a.png"]
+
+    results = await asyncio.gather(*(cache.get_or_run("cats", search) for _ in range(3)))
+    results[0].append("mutated")
+    results.append(await cache.get_or_run("cats", search))
+
+    assert calls == 1
+    assert results[1:] == [["https://example.com/a.png"]] * 3
+
+
+@pytest.mark.asyncio
+async def test_get_or_run_does_not_cache_failures():
+    """A failed call should be run again on the next request."""
+    cache: AsyncTTLCache[list[str]] = AsyncTTLCache(ttl_seconds=60, max_entries=8, copy=list)
+    calls = 0
+
+    async def search():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("provider down")
+        return ["https://example.com/b.png"]
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_run("dogs", search)
+
+    assert await cache.get_or_run("dogs", search) == ["https://example.com/b.png"]
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_run_evicts_oldest_when_full():
+    """Once full, the oldest result should make room for a new one."""
+    cache: AsyncTTLCache[str] = AsyncTTLCache(ttl_seconds=60, max_entries=2, copy=str)
+    calls: list[str] = []
+
+    def search(key: str):
+        async def run():
+            calls.append(key)
+            return key
+        return run
+
+    for key in ("a", "b", "c", "b", "a"):
+        await cache.get_or_run(key, search(key))
+
+    assert calls == ["a", "b", "c", "a"]
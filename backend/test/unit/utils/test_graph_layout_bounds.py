@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
-from topix.datatypes.file.document import Document
-from topix.datatypes.note.note import Note
+from topix.datatypes.file.document import Document, DocumentProperties
+from topix.datatypes.note.note import Note, NoteProperties
 from topix.datatypes.property import PositionProperty, SizeProperty
 from topix.utils.graph.layout import displace_nodes, get_bounds
 
 
+def _geom(x: float, y: float, w: float, h: float) -> dict:
+    # Built with model_construct: the geometry is trusted, so skip validation.
+    return {
+        "node_position": PositionProperty.model_construct(
+            position=PositionProperty.Position.model_construct(x=float(x), y=float(y))
+        ),
+        "node_size": SizeProperty.model_construct(
+            size=SizeProperty.Size.model_construct(width=float(w), height=float(h))
+        ),
+    }
+
+
 def _note_with_geom(x: float, y: float, w: float, h: float) -> Note:
-    note = Note()
-    note.properties.node_position.position = PositionProperty.Position(x=x, y=y)
-    note.properties.node_size.size = SizeProperty.Size(width=w, height=h)
-    return note
+    return Note.model_construct(properties=NoteProperties.model_construct(**_geom(x, y, w, h)))
 
 
 def _doc_with_geom(x: float, y: float, w: float, h: float) -> Document:
-    doc = Document()
-    doc.properties.node_position.position = PositionProperty.Position(x=x, y=y)
-    doc.properties.node_size.size = SizeProperty.Size(width=w, height=h)
-    return doc
+    return Document.model_construct(properties=DocumentProperties.model_construct(**_geom(x, y, w, h)))
 
 
 def test_get_bounds_empty_nodes():
@@ -1,13 +1,17 @@
 """Main agent manager."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 
 from collections.abc import AsyncGenerator
 
+from agents import MaxTurnsExceeded
+
 from topix.agents.assistant.plan import Plan
 from topix.agents.config import AssistantManagerConfig
+from topix.agents.datatypes.annotations import RefAnnotation
 from topix.agents.datatypes.context import ReasoningContext
 from topix.agents.datatypes.reasoning_step import ReasoningStep
 from topix.agents.datatypes.stream import (
@@ -29,6 +33,12 @@ from topix.utils.common import gen_uid
 
 logger = logging.getLogger(__name__)
 
+# Streamed content types whose text is buffered into the persisted reasoning steps.
+BUFFERED_CONTENT_TYPES = frozenset({ContentType.MESSAGE, ContentType.TOKEN})
+
+# Shortened note references emitted by the model, e.g. "(/note/ab12)".
+SHORT_REF_RE = re.compile(r"\(/(?P<rtype>[a-z_]+)/(?P<prefix>[a-zA-Z0-9]{4,})\)")
+
 
 class AssistantManager:
     """Orchestrates the full flow: query rewrite, planning, searching ..."""
@@ -84,7 +94,42 @@ class AssistantManager:
                 return [{"role": "user", "content": query}]
         return [{"role": "user", "content": query}]
 
-    async def _postprocess_answer(  # noqa: C901
+    def _persist_user_message(
+        self,
+        query: str,
+        session: AssistantSession | None,
+        message_id: str | None = None,
+        message_context: str | None = None,
+    ) -> asyncio.Task | None:
+        """Start storing the user message in the session without waiting for it.
+
+        History has already been read by `_compose_input`, so the write can run
+        alongside the plan agent. The returned task is awaited before the assistant
+        answer is stored, so a failed write stops the run without storing a reply.
+        """
+        if not session:
+            return None
+
+        user_message = Message(
+            id=message_id or gen_uid(),
+            role="user",
+            content=RichText(markdown=query)
+        )
+        if message_context is not None and message_context.strip() != "":
+            user_message.properties.context = TextProperty(text=message_context)
+
+        return asyncio.create_task(session.add_items([user_message]))
+
+    @staticmethod
+    async def _settle_user_message(task: asyncio.Task | None) -> None:
+        """Wait for the user message write on every exit path, e.g. on client disconnect.
+
+        A failed write is raised here as on the normal path, so it is never left unawaited.
+        """
+        if task is not None:
+            await task
+
+    async def _postprocess_answer(
         self,
         answer: str,
         context: ReasoningContext,
@@ -96,43 +141,36 @@ class AssistantManager:
         else:
             graph_uid = None
 
-        short_ref_re = re.compile(r"\(/(?P<rtype>[a-z_]+)/(?P<prefix>[a-zA-Z0-9]{4,})\)")
-
         valid_urls = []
+        # Refs from every memory search, grouped by type and kept in tool call order.
+        refs_by_type: dict[str, list[RefAnnotation]] = {}
         for tool_call in context.tool_calls:
             if tool_call.name == AgentToolName.WEB_SEARCH:
-                search_results = tool_call.output.search_results
-                for result in search_results:
-                    valid_urls.append(result.url)
+                valid_urls.extend(result.url for result in tool_call.output.search_results)
 
             # Correct shortened URLs in the answer by replacing shortened IDs with full IDs
-            elif tool_call.name == AgentToolName.MEMORY_SEARCH:
-                if graph_uid is not None:
-                    refs = tool_call.output.references
-
-                    # Each ref is a full ID; we match on any prefix the model emits.
-                    def replace_match(match: re.Match[str]) -> str:
-                        # Replace /:type/:prefix with the first matching full ID for that type.
-                        rtype = match.group("rtype")
-                        prefix = match.group("prefix")
-                        found = None
-
-                        for ref in refs:
-                            if ref.ref_type != rtype:
-                                continue
-                            if ref.ref_id.startswith(prefix):
-                                found = ref
-                                break
-
-                        if not found:
-                            return match.group(0)
+            elif tool_call.name == AgentToolName.MEMORY_SEARCH and graph_uid is not None:
+                for ref in tool_call.output.references:
+                    refs_by_type.setdefault(ref.ref_type, []).append(ref)
+
+        if refs_by_type:
+            # Each ref is a full ID; we match on any prefix the model emits.
+            def replace_match(match: re.Match[str]) -> str:
+                # Replace /:type/:prefix with the first matching full ID for that type.
+                prefix = match.group("prefix")
+                found = next(
+                    (ref for ref in refs_by_type.get(match.group("rtype"), ()) if ref.ref_id.startswith(prefix)),
+                    None,
+                )
+                if not found:
+                    return match.group(0)
 
-                        target_type = found.parent_type or found.ref_type
-                        target_id = found.parent_id or found.ref_id
+                target_type = found.parent_type or found.ref_type
+                target_id = found.parent_id or found.ref_id
 
-                        return f"(/boards/{graph_uid}/{target_type}s/{target_id})"
+                return f"(/boards/{graph_uid}/{target_type}s/{target_id})"
 
-                    answer = short_ref_re.sub(replace_match, answer)
+            answer = SHORT_REF_RE.sub(replace_match, answer)
 
         return post_process_url_citations(answer, valid_urls)
 
@@ -153,34 +191,38 @@ class AssistantManager:
             message_context=message_context
         )
 
-        if session:
-            user_message = Message(
-                id=message_id or gen_uid(),
-                role="user",
-                content=RichText(markdown=query)
-            )
-            if message_context is not None and message_context.strip() != "":
-                user_message.properties.context = TextProperty(text=message_context)
-
-            await session.add_items([user_message])
+        persist_user_message = self._persist_user_message(
+            query,
+            session,
+            message_id=message_id,
+            message_context=message_context,
+        )
 
-        # launch plan:
-        res = ""
         try:
-            res = await AgentRunner.run(
-                self.plan_agent, input=agent_input, context=context, max_turns=max_turns
-            )
-        except Exception:
-            logger.info(f"Max turns exceeded: {max_turns}", exc_info=True)
-
-        if session:
-            await session.add_items(
-                [{"id": gen_uid(), "role": "assistant", "content": {"markdown": res}}]
-            )
+            # launch plan:
+            res = ""
+            try:
+                res = await AgentRunner.run(
+                    self.plan_agent, input=agent_input, context=context, max_turns=max_turns
+                )
+            except MaxTurnsExceeded:
+                # Expected when the plan runs out of turns; no traceback needed.
+                logger.info("Max turns exceeded: %s", max_turns)
+            except Exception:
+                logger.error("Plan agent execution error", exc_info=True)
+
+            if session:
+                # Only store the answer once its question is stored.
+                await persist_user_message
+                await session.add_items(
+                    [{"id": gen_uid(), "role": "assistant", "content": {"markdown": res}}]
+                )
 
-        res = await self._postprocess_answer(res, context)
+            res = await self._postprocess_answer(res, context)
 
-        return res
+            return res
+        finally:
+            await self._settle_user_message(persist_user_message)
 
     async def run_streamed(  # noqa: C901
         self,
@@ -208,15 +250,12 @@ class AssistantManager:
             message_context=message_context
         )
 
-        if session:
-            user_message = Message(
-                id=message_id or gen_uid(),
-                role="user",
-                content=RichText(markdown=query)
-            )
-            if message_context is not None and message_context.strip() != "":
-                user_message.properties.context = TextProperty(text=message_context)
-            await session.add_items([user_message])
+        persist_user_message = self._persist_user_message(
+            query,
+            session,
+            message_id=message_id,
+            message_context=message_context,
+        )
 
         current_message_buffer: list[str] = []
         current_reasoning_buffer: list[str] = []
@@ -253,57 +292,63 @@ class AssistantManager:
             )
 
         try:
-            res = AgentRunner.run_streamed(
-                self.plan_agent, input=agent_input, context=context, max_turns=max_turns
-            )
+            try:
+                res = AgentRunner.run_streamed(
+                    self.plan_agent, input=agent_input, context=context, max_turns=max_turns
+                )
 
-            async for message in res:
-                if isinstance(message, ToolCall):
-                    flush_current_buffers()
-                    persisted_steps.append(message)
-                    yield message
-                    continue
-
-                if message.tool_name == AgentToolName.RAW_MESSAGE:
-                    current_raw_tool_id = message.tool_id
-                    if (
-                        message.content
-                        and message.content.type in [ContentType.MESSAGE, ContentType.TOKEN]
-                    ):
-                        if message.type == StreamingMessageType.STREAM_MESSAGE:
-                            current_message_buffer.append(message.content.text)
-                        elif message.type == StreamingMessageType.STREAM_REASONING_MESSAGE:
-                            current_reasoning_buffer.append(message.content.text)
-
-                    if message.is_stop:
+                async for message in res:
+                    if isinstance(message, ToolCall):
                         flush_current_buffers()
+                        persisted_steps.append(message)
+                        yield message
+                        continue
+
+                    if message.tool_name == AgentToolName.RAW_MESSAGE:
+                        current_raw_tool_id = message.tool_id
+                        if (
+                            message.content
+                            and message.content.type in BUFFERED_CONTENT_TYPES
+                        ):
+                            if message.type == StreamingMessageType.STREAM_MESSAGE:
+                                current_message_buffer.append(message.content.text)
+                            elif message.type == StreamingMessageType.STREAM_REASONING_MESSAGE:
+                                current_reasoning_buffer.append(message.content.text)
+
+                        if message.is_stop:
+                            flush_current_buffers()
 
-                yield message
-        except Exception as e:
-            logger.error(
-                f"Plan agent execution error {e}, may due to Max turns exceeded",
-                exc_info=True,
-            )
+                    yield message
+            except Exception as e:
+                logger.error(
+                    f"Plan agent execution error {e}, may due to Max turns exceeded",
+                    exc_info=True,
+                )
 
-        flush_current_buffers()
+            # Everything below only builds the persisted assistant message.
+            if not session:
+                return
 
-        final_reasoning_step = next(
-            (
-                step
-                for step in reversed(persisted_steps)
-                if isinstance(step, ReasoningStep) and step.message
-            ),
-            None,
-        )
-        if final_reasoning_step is not None:
-            final_reasoning_step.message = await self._postprocess_answer(
-                final_reasoning_step.message,
-                context,
+            flush_current_buffers()
+
+            final_reasoning_step = next(
+                (
+                    step
+                    for step in reversed(persisted_steps)
+                    if isinstance(step, ReasoningStep) and step.message
+                ),
+                None,
             )
+            if final_reasoning_step is not None:
+                final_reasoning_step.message = await self._postprocess_answer(
+                    final_reasoning_step.message,
+                    context,
+                )
 
-        persisted_content = build_message_content()
+            persisted_content = build_message_content()
 
-        if session:
+            # Only store the answer once its question is stored.
+            await persist_user_message
             await session.add_items(
                 [
                     Message(
@@ -317,3 +362,5 @@ class AssistantManager:
                     )
                 ]
             )
+        finally:
+            await self._settle_user_message(persist_user_message)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from functools import lru_cache
 
 from agents import (
     FunctionTool,
@@ -24,11 +24,17 @@ from topix.agents.widgets.finance import display_stock_widget_tool
 from topix.agents.widgets.image import display_image_search_widget_tool
 from topix.agents.widgets.learn import learn_generate_html_widget_tool
 from topix.agents.widgets.weather import display_weather_widget_tool
-from topix.api.utils.common import iso_to_clear_date
+from topix.api.utils.common import now_to_clear_date
 from topix.store.graph import GraphStore
 from topix.store.qdrant.store import ContentStore
 
 
+@lru_cache(maxsize=64)
+def _render_plan_instructions(instructions_template: str, time: str) -> str:
+    """Render the plan system prompt; its only input is the minute-resolution time, so renders are shared per minute."""
+    return Plan._render_prompt(instructions_template, time=time)
+
+
 class Plan(BaseAgent):
     """Manager for the reflection agent."""
 
@@ -41,9 +47,9 @@ class Plan(BaseAgent):
     ):
         """Init method."""
         name = "Plan"
-        instructions = self._render_prompt(
+        instructions = _render_plan_instructions(
             instructions_template,
-            time=iso_to_clear_date(datetime.now().isoformat()),
+            now_to_clear_date(),
         )
 
         model_settings = model_settings or ModelSettings(max_tokens=8000)
@@ -119,7 +125,7 @@ class Plan(BaseAgent):
             "plan.user.jinja",
             messages=messages,
             user_query=user_query,
-            time=iso_to_clear_date(datetime.now().isoformat()),
+            time=now_to_clear_date(),
         )
 
         return user_prompt
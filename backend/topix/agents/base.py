@@ -3,7 +3,6 @@
 import logging
 
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Any, AsyncGenerator
 
 import litellm
@@ -16,11 +15,6 @@ from agents import (
     Tool,
 )
 from agents.extensions.models.litellm_model import LitellmModel
-from jinja2 import Template
-from openai.types.responses import (
-    ResponseReasoningSummaryTextDeltaEvent,
-    ResponseTextDeltaEvent,
-)
 from pydantic import BaseModel
 
 from topix.agents.config import BaseAgentConfig
@@ -37,10 +31,10 @@ from topix.agents.datatypes.stream import (
     AgentStreamMessage,
     Content,
     ContentType,
-    StreamingMessageType,
 )
 from topix.agents.datatypes.tools import AgentToolName
-from topix.agents.tool_handler import ToolHandler
+from topix.agents.prompt_utils import render_prompt
+from topix.agents.tool_handler import STREAM_DELTA_MESSAGE_TYPES, ToolHandler
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +42,6 @@ litellm.drop_params = True
 
 
 RAW_RESPONSE_EVENT = "raw_response_event"
-PROMPT_DIR = Path(__file__).parent.parent / "prompts"
 
 
 @dataclass
@@ -197,44 +190,32 @@ class BaseAgent(Agent[Context]):
 
         Load a prompt template from the prompts directory.
         """
-        with open(PROMPT_DIR / filename, "r", encoding="utf-8") as f:
-            template_str = f.read()
-            template: Template = Template(template_str)
-            return template.render(**kwargs)
+        return render_prompt(filename, **kwargs)
 
     async def _handle_stream_events(
         self, stream_response: RunResultStreaming, **fixed_params
     ) -> AsyncGenerator[AgentStreamMessage, None]:
         """Handle streaming events from the agent."""
-        event_type_map = {
-            ResponseTextDeltaEvent: StreamingMessageType.STREAM_MESSAGE,
-            ResponseReasoningSummaryTextDeltaEvent: StreamingMessageType.STREAM_REASONING_MESSAGE,
-        }
-
         async for event in stream_response.stream_events():
-            if event.type == RAW_RESPONSE_EVENT:
-                for cls, msg_type in event_type_map.items():
-                    if isinstance(event.data, cls):
-                        yield AgentStreamMessage(
-                            type=msg_type,
-                            content=Content(
-                                type=ContentType.TOKEN, text=event.data.delta
-                            ),
-                            **fixed_params,
-                            is_stop=False,
-                        )
+            if event.type != RAW_RESPONSE_EVENT:
+                continue
+            msg_type = STREAM_DELTA_MESSAGE_TYPES.get(type(event.data))
+            if msg_type is not None:
+                yield AgentStreamMessage(
+                    type=msg_type,
+                    content=Content(
+                        type=ContentType.TOKEN, text=event.data.delta
+                    ),
+                    **fixed_params,
+                    is_stop=False,
+                )
 
     def force_tool(
         self,
         tool_name: AgentToolName,
     ):
         """Force the agent to use a specific tool."""
-        tool = None
-        for t in self.tools:
-            if t.name == tool_name:
-                tool = t
-                break
-
+        tool = next((t for t in self.tools if t.name == tool_name), None)
         if tool is None:
             raise ValueError(f"Tool {tool_name} not found in agent {self.name}")
 
@@ -243,8 +224,6 @@ class BaseAgent(Agent[Context]):
 
     def set_enabled_tools(self, tool_names: list[AgentToolName]):
         """Set Agent tool from `tool_names`, other tools will be disabled."""
+        enabled_names = set(tool_names)
         for tool in self.tools:
-            if tool.name in tool_names:
-                tool.is_enabled = True
-            else:
-                tool.is_enabled = False
+            tool.is_enabled = tool.name in enabled_names
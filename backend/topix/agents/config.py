@@ -1,24 +1,38 @@
 """Agent Config classes."""
 
+import copy
 import logging
+import os
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-import yaml
-
 from agents import ModelSettings
 from pydantic import BaseModel, ConfigDict, field_validator
 
 from topix.agents.datatypes.web_search import WebSearchContextSize, WebSearchOption
 from topix.config.services import service_config
 from topix.datatypes.recurrence import Recurrence
+from topix.utils.common import load_yaml
 
 CONFIG_DIR = Path(__file__).parent / "configs"
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _parse_config_file(filepath: str, mtime: float) -> dict:
+    """Parse a YAML config file; `mtime` is part of the cache key so edits are picked up."""
+    with open(filepath) as f:
+        return load_yaml(f)
+
+
+def _read_config_file(filepath: str | Path) -> dict:
+    """Return a private copy of the parsed YAML config, safe to modify before validation."""
+    return copy.deepcopy(_parse_config_file(str(filepath), os.path.getmtime(filepath)))
+
+
 class BaseConfig(BaseModel):
     """Base Config class for Agent/Tool."""
 
@@ -135,11 +149,14 @@ class AssistantManagerConfig(BaseModel):
 
     @staticmethod
     def from_yaml(filepath: str | None = None):
-        """Create an instance of ManagerConfig from a YAML file."""
+        """Create an instance of ManagerConfig from a YAML file.
+
+        The YAML is parsed once per file version; validation runs on every call since it
+        depends on the available services.
+        """
         if not filepath:
             filepath = CONFIG_DIR / "assistant.yml"
-        with open(filepath) as f:
-            cf = yaml.safe_load(f)
+        cf = _read_config_file(filepath)
 
         if 'plan' in cf:
             if len(service_config.navigate) == 0:
@@ -189,11 +206,14 @@ class DeepResearchConfig(BaseModel):
 
     @staticmethod
     def from_yaml(filepath: str | None = None):
-        """Create an instance of LearningModuleConfig from a YAML file."""
+        """Create an instance of LearningModuleConfig from a YAML file.
+
+        The YAML is parsed once per file version; validation runs on every call since it
+        depends on the available services.
+        """
         if not filepath:
             filepath = CONFIG_DIR / "deep_research.yml"
-        with open(filepath) as f:
-            cf = yaml.safe_load(f)
+        cf = _read_config_file(filepath)
         return DeepResearchConfig.model_validate(cf)
 
     def set_model(self, model: str):
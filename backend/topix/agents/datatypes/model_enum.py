@@ -60,85 +60,91 @@ class ModelEnum:
     OpenRouter = OpenRouterModel
 
 
+# Model capability tables, built once at import and shared by the `support_*` checks.
+NO_TEMPERATURE_MODELS = frozenset({
+    OpenAIModel.GPT_5,
+    OpenAIModel.GPT_5_MINI,
+    OpenAIModel.GPT_5_NANO,
+    OpenAIModel.GPT_5_4,
+    OpenAIModel.GPT_5_4_MINI,
+    OpenAIModel.GPT_5_4_NANO,
+    OpenAIModel.GPT_5_1_CHAT,
+})
+
+REASONING_MODELS = frozenset({
+    # OpenAI reasoning-capable
+    OpenAIModel.GPT_5_1,
+    OpenAIModel.GPT_5_1_CHAT,
+    OpenAIModel.GPT_5,
+    OpenAIModel.GPT_5_MINI,
+    OpenAIModel.GPT_5_NANO,
+    OpenAIModel.GPT_5_2,
+    OpenAIModel.GPT_5_2_CHAT,
+    OpenAIModel.GPT_5_4,
+    OpenAIModel.GPT_5_4_MINI,
+    OpenAIModel.GPT_5_4_NANO,
+
+    # Gemini reasoning-capable
+    GeminiModel.GEMINI_2_5_FLASH,
+    GeminiModel.GEMINI_2_5_PRO,
+
+    # Perplexity reasoning-capable
+    PerplexityModel.PERPLEXITY_SONAR
+})
+
+REASONING_EFFORT_INSTANT_MODELS = frozenset({OpenAIModel.GPT_5_1_CHAT})
+
+REASONING_EFFORT_NONE_MODELS = frozenset({
+    OpenAIModel.GPT_5_1,
+    OpenAIModel.GPT_5_4,
+    OpenAIModel.GPT_5_4_MINI,
+    OpenAIModel.GPT_5_4_NANO,
+    OpenAIModel.GPT_5_2,
+    OpenAIModel.GPT_5_2_CHAT
+})
+
+NO_PENALTIES_MODELS = frozenset({
+    OpenAIModel.GPT_4O,
+    OpenAIModel.GPT_4O_MINI,
+    OpenAIModel.GPT_4_1,
+    OpenAIModel.GPT_4_1_MINI,
+    OpenAIModel.GPT_4_1_NANO,
+    OpenAIModel.GPT_5_1_CHAT,
+    OpenAIModel.GPT_5,
+    OpenAIModel.GPT_5_MINI,
+    OpenAIModel.GPT_5_NANO,
+    OpenAIModel.GPT_5_4,
+    OpenAIModel.GPT_5_4_MINI,
+    OpenAIModel.GPT_5_4_NANO,
+    GeminiModel.GEMINI_2_5_FLASH,
+    GeminiModel.GEMINI_2_5_PRO,
+})
+
+
 def support_temperature(model: str) -> bool:
     """Check if the model supports temperature.
 
     Temperature is possibly not supported in reasoning models due to
     introduced newer parameters like `verbosity` or `reasoning_effort`.
     """
-    if model in [
-        OpenAIModel.GPT_5,
-        OpenAIModel.GPT_5_MINI,
-        OpenAIModel.GPT_5_NANO,
-        OpenAIModel.GPT_5_4,
-        OpenAIModel.GPT_5_4_MINI,
-        OpenAIModel.GPT_5_4_NANO,
-        OpenAIModel.GPT_5_1_CHAT,
-    ]:
-        return False
-    return True
+    return model not in NO_TEMPERATURE_MODELS
 
 
 def support_reasoning(model: str) -> bool:
     """Check if the model supports reasoning."""
-    reasoning_models = {
-        # OpenAI reasoning-capable
-        OpenAIModel.GPT_5_1,
-        OpenAIModel.GPT_5_1_CHAT,
-        OpenAIModel.GPT_5,
-        OpenAIModel.GPT_5_MINI,
-        OpenAIModel.GPT_5_NANO,
-        OpenAIModel.GPT_5_2,
-        OpenAIModel.GPT_5_2_CHAT,
-        OpenAIModel.GPT_5_4,
-        OpenAIModel.GPT_5_4_MINI,
-        OpenAIModel.GPT_5_4_NANO,
-
-        # Gemini reasoning-capable
-        GeminiModel.GEMINI_2_5_FLASH,
-        GeminiModel.GEMINI_2_5_PRO,
-
-        # Perplexity reasoning-capable
-        PerplexityModel.PERPLEXITY_SONAR
-    }
-
-    return model in reasoning_models
+    return model in REASONING_MODELS
 
 
 def support_reasoning_effort_instant_mode(model: str) -> bool:
     """Check if the model supports instant reasoning effort."""
-    return model in [OpenAIModel.GPT_5_1_CHAT]
+    return model in REASONING_EFFORT_INSTANT_MODELS
 
 
 def support_reasoning_effort_none(model: str) -> bool:
     """Check if the model supports 'none' reasoning effort."""
-    return model in [
-        OpenAIModel.GPT_5_1,
-        OpenAIModel.GPT_5_4,
-        OpenAIModel.GPT_5_4_MINI,
-        OpenAIModel.GPT_5_4_NANO,
-        OpenAIModel.GPT_5_2,
-        OpenAIModel.GPT_5_2_CHAT
-    ]
+    return model in REASONING_EFFORT_NONE_MODELS
 
 
 def support_penalties(model: str) -> bool:
     """Check if the model supports frequency and presence penalty."""
-    if model in [
-        OpenAIModel.GPT_4O,
-        OpenAIModel.GPT_4O_MINI,
-        OpenAIModel.GPT_4_1,
-        OpenAIModel.GPT_4_1_MINI,
-        OpenAIModel.GPT_4_1_NANO,
-        OpenAIModel.GPT_5_1_CHAT,
-        OpenAIModel.GPT_5,
-        OpenAIModel.GPT_5_MINI,
-        OpenAIModel.GPT_5_NANO,
-        OpenAIModel.GPT_5_4,
-        OpenAIModel.GPT_5_4_MINI,
-        OpenAIModel.GPT_5_4_NANO,
-        GeminiModel.GEMINI_2_5_FLASH,
-        GeminiModel.GEMINI_2_5_PRO,
-    ]:
-        return False
-    return True
+    return model not in NO_PENALTIES_MODELS
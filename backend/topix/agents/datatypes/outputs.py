@@ -131,17 +131,16 @@ class WebSearchOutput(BaseModel):
         """Convert output to string."""
         if not self.answer:
             # raw search results
-            formatted = "Search Results:\n\n"
-            for result in self.search_results:
-                formatted += (
-                    "\n<Source"
-                    f"\n  url=\"{result.url}\""
-                    f"\n  title=\"{result.title}\""
-                    "\n>"
-                    f"\n{result.content}\n"
-                    "\n</Source>\n"
-                )
-            return formatted
+            sources = (
+                "\n<Source"
+                f"\n  url=\"{result.url}\""
+                f"\n  title=\"{result.title}\""
+                "\n>"
+                f"\n{result.content}\n"
+                "\n</Source>\n"
+                for result in self.search_results
+            )
+            return "Search Results:\n\n" + "".join(sources)
         else:
             """The final output of the Websearch Agent."""
             return self.answer
@@ -210,21 +209,21 @@ class MemorySearchOutput(BaseModel):
             return self.answer
 
         # TODO: Voir pr document_label plus tard
-        formatted = "Memory search Results:\n\n"
+        parts = ["Memory search Results:\n\n"]
         for reference in self.references:
             if reference.label or reference.content:
                 note_id = reference.ref_id
                 url = f"/{reference.ref_type}/{note_id[:5]}"
-                formatted += f"\n<Source\n  id=\"{note_id}\"\n  url=\"{url}\""
+                parts.append(f"\n<Source\n  id=\"{note_id}\"\n  url=\"{url}\"")
                 if reference.label:
-                    formatted += f"\n  label=\"{reference.label}\""
-                formatted += (
+                    parts.append(f"\n  label=\"{reference.label}\"")
+                parts.append(
                     f"\n  type=\"{reference.ref_type}\""
                     "\n>"
                     f"\n{reference.content or ""}\n"
                     "\n</Source>\n"
                 )
-        return formatted
+        return "".join(parts)
 
 
 class ImageGenerationOutput(BaseModel):
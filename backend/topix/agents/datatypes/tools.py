@@ -34,13 +34,16 @@ class AgentToolName(StrEnum):
     IMAGE_GENERATION = "image_generation"
 
 
+DISPLAY_OUTPUT_TOOLS = frozenset({
+    AgentToolName.ANSWER_REFORMULATE,
+    AgentToolName.RAW_MESSAGE,
+    AgentToolName.SYNTHESIZER,
+})
+
+
 def to_display_output(tool_name: str) -> bool:
     """Check if the tool is for displaying output."""
-    return tool_name in [
-        AgentToolName.ANSWER_REFORMULATE,
-        AgentToolName.RAW_MESSAGE,
-        AgentToolName.SYNTHESIZER,
-    ]
+    return tool_name in DISPLAY_OUTPUT_TOOLS
 
 
 tool_descriptions = {
@@ -2,7 +2,6 @@
 
 import logging
 
-from datetime import datetime
 from typing import AsyncGenerator
 
 from agents import FunctionTool, ModelSettings
@@ -17,7 +16,7 @@ from topix.agents.datatypes.tools import AgentToolName
 from topix.agents.run import AgentRunner
 from topix.agents.sessions import AssistantSession, Message
 from topix.agents.websearch.handler import WebSearchHandler
-from topix.api.utils.common import iso_to_clear_date
+from topix.api.utils.common import now_to_clear_date
 from topix.datatypes.property import ReasoningProperty, TextProperty
 from topix.datatypes.resource import RichText
 from topix.utils.common import gen_uid
@@ -39,7 +38,7 @@ class WebCollector(BaseAgent):
         name = "Web Collector"
         instructions = self._render_prompt(
             instructions_template,
-            time=iso_to_clear_date(datetime.now().isoformat()),
+            time=now_to_clear_date(),
         )
         if model_settings is None:
             model_settings = ModelSettings(max_tokens=8000)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 import logging
 
+from functools import lru_cache
 from typing import Literal
 
 from agents import ModelSettings
@@ -15,6 +16,11 @@ from topix.agents.datatypes.model_enum import ModelEnum
 from topix.agents.datatypes.outputs import ImageDescriptionOutput
 from topix.agents.run import AgentRunner
 
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENT_IMAGE_DESCRIPTIONS = 8
+description_semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGE_DESCRIPTIONS)
+
 
 class ImageMessageContent(BaseModel):
     """Content model for image messages.
@@ -37,6 +43,11 @@ class ImageDescriptionInput(BaseModel):
         """Create an ImageDescriptionInput from an image URL."""
         return cls(content=[ImageMessageContent(image_url=image_url)])
 
+    @staticmethod
+    def message_from_url(image_url: str) -> dict:
+        """Build the dumped form of `from_url(image_url)` without going through validation."""
+        return {"role": "user", "content": [{"type": "input_image", "image_url": image_url}]}
+
 
 class ImageDescriptionAgent(BaseAgent):
     """Agent to describe images given their URLs."""
@@ -64,6 +75,17 @@ class ImageDescriptionAgent(BaseAgent):
         super().__post_init__()
 
 
+@lru_cache(maxsize=1)
+def get_description_agent() -> ImageDescriptionAgent:
+    """Return the shared image description agent.
+
+    The agent holds no per-run state, so one instance is reused by every
+    description instead of re-rendering its prompt and model settings per image.
+    Call `get_description_agent.cache_clear()` to rebuild it, e.g. in tests.
+    """
+    return ImageDescriptionAgent()
+
+
 async def describe_images(
     image_urls: list[str],
 ) -> list[ImageDescriptionOutput | None]:
@@ -76,20 +98,22 @@ async def describe_images(
         list of image descriptions.
 
     """
+    agent = get_description_agent()
     description_inputs = [
-        [ImageDescriptionInput.from_url(image_url)]
+        [ImageDescriptionInput.message_from_url(image_url)]
         for image_url in image_urls
     ]
 
     async def run_description(
-        input: list[ImageDescriptionInput]
+        input: list[dict]
     ) -> ImageDescriptionOutput | None:
         """Wrap the execution of the description agent for a single image input."""
         try:
-            description = await AgentRunner.run(ImageDescriptionAgent(), input=input, context=Context())
+            async with description_semaphore:
+                description = await AgentRunner.run(agent, input=input, context=Context())
             return description
         except Exception as e:
-            logging.warning(f"Error while trying to describe image: {e}", exc_info=True)
+            logger.warning("Error while trying to describe image: %s", e, exc_info=True)
             return None
 
     description_tasks = [run_description(input) for input in description_inputs]
@@ -77,6 +77,8 @@ class TopicIllustrator(BaseAgent):
             else:
                 raise ValueError(f"Unsupported image search engine: {self.image_search_engine}")
 
+            # providers often return the same image for related pages; describe each once
+            image_urls = list(dict.fromkeys(image_urls))
             descriptions = await describe_images(image_urls)
             return [
                 (url, description)
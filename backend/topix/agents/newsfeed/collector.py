@@ -1,8 +1,6 @@
 """Newsfeed agent."""
 from __future__ import annotations
 
-from datetime import datetime
-
 from agents import ModelSettings, Tool
 from pydantic import BaseModel
 
@@ -12,7 +10,7 @@ from topix.agents.datatypes.outputs import NewsfeedOutput
 from topix.agents.newsfeed.config import NewsfeedCollectorConfig, NewsfeedSynthesizerConfig
 from topix.agents.newsfeed.context import NewsfeedContext
 from topix.agents.websearch.handler import WebSearchHandler
-from topix.api.utils.common import iso_to_clear_date
+from topix.api.utils.common import now_to_clear_date
 from topix.datatypes.newsfeed.subscription import Subscription
 
 
@@ -37,7 +35,7 @@ class NewsfeedCollector(BaseAgent):
         name = "Newsfeed Collector"
         instructions = self._render_prompt(
             instructions_template,
-            time=iso_to_clear_date(datetime.now().isoformat()),
+            time=now_to_clear_date(),
         )
 
         if not web_search:
@@ -103,7 +101,7 @@ class NewsfeedSynthesizer(BaseAgent):
         name = "Newsfeed Source Picker"
         instructions = self._render_prompt(
             instructions_template,
-            time=iso_to_clear_date(datetime.now().isoformat()),
+            time=now_to_clear_date(),
         )
 
         super().__init__(
@@ -141,7 +139,7 @@ class NewsfeedSynthesizer(BaseAgent):
         history_str = '\n'.join(f"- {title} ({url})" for url, title in input.history) if input.history else "None"
         return self._render_prompt(
             "newsfeed/synthesizer.user.jinja",
-            time=iso_to_clear_date(datetime.now().isoformat()),
+            time=now_to_clear_date(),
             topic=input.subscription.label.markdown,
             sub_topics=sub_topics_str,
             description=input.subscription.properties.description.text,
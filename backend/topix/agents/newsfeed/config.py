@@ -4,9 +4,9 @@ from __future__ import annotations
 from pathlib import Path
 
 from pydantic import BaseModel
-from yaml import safe_load
 
 from topix.agents.config import BaseAgentConfig, WebSearchConfig
+from topix.utils.common import load_yaml
 
 NEWSFEED_DEFAULT_CONFIG_FILE = Path(__file__).parent / "config.yml"
 
@@ -42,6 +42,6 @@ class NewsfeedPipelineConfig(BaseModel):
         if config_file is None:
             config_file = str(NEWSFEED_DEFAULT_CONFIG_FILE)
         with open(config_file) as f:
-            cf = safe_load(f)
+            cf = load_yaml(f)
 
         return cls.model_validate(cf)
@@ -1,6 +1,8 @@
 """Newsfeed pipeline."""
 from __future__ import annotations
 
+import httpx
+
 from agents import MaxTurnsExceeded
 
 from topix.agents.datatypes.annotations import SearchResult
@@ -16,7 +18,7 @@ from topix.datatypes.newsfeed.subscription import Subscription, SubscriptionProp
 from topix.datatypes.property import MultiSourceProperty, MultiTextProperty, TextProperty
 from topix.datatypes.resource import RichText
 from topix.store.qdrant.store import ContentStore
-from topix.utils.web.favicon import fetch_meta_images_batch
+from topix.utils.web.favicon import create_meta_images_client, fetch_meta_images_batch
 
 COLLECTOR_MAX_TURNS = 50
 
@@ -36,6 +38,8 @@ class NewsfeedPipeline:
         self.topic_setup = topic_setup or TopicSetup()
         self.collector = collector or NewsfeedCollector()
         self.synthesizer = synthesizer or NewsfeedSynthesizer()
+        # Long-lived client so favicon/cover fetches reuse connections across runs
+        self._meta_images_client: httpx.AsyncClient | None = None
 
     @classmethod
     def from_config(cls, config: NewsfeedPipelineConfig, content_store: ContentStore | None = None) -> NewsfeedPipeline:
@@ -105,8 +109,11 @@ class NewsfeedPipeline:
 
     async def _add_articles_annotations(self, hits: list[SearchResult]) -> list[SearchResult]:
         """Add article annotations to content store."""
+        if self._meta_images_client is None:
+            self._meta_images_client = create_meta_images_client()
         meta_images = await fetch_meta_images_batch(
-            [result.url for result in hits]
+            [result.url for result in hits],
+            client=self._meta_images_client,
         )
         for result in hits:
             if result.url not in meta_images:
@@ -118,6 +125,12 @@ class NewsfeedPipeline:
                 result.cover_image = str(images.cover_image) if images.cover_image else None
         return hits
 
+    async def aclose(self):
+        """Close the HTTP client used to fetch article meta images."""
+        if self._meta_images_client is not None:
+            await self._meta_images_client.aclose()
+            self._meta_images_client = None
+
     def _extract_existing_urls(self, history: list[Newsfeed]) -> list[tuple[str, str]]:
         """Extract existing URLs + titles from history."""
         existing_urls = []
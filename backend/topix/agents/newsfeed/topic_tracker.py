@@ -1,8 +1,6 @@
 """Topic tracker agent."""
 from __future__ import annotations
 
-from datetime import datetime
-
 from agents import ModelSettings, Tool
 from pydantic import BaseModel
 
@@ -12,7 +10,7 @@ from topix.agents.datatypes.outputs import TopicTracker
 from topix.agents.newsfeed.config import TopicSetupConfig
 from topix.agents.newsfeed.default_seed_sources import DefaultSeedSources
 from topix.agents.websearch.handler import WebSearchHandler
-from topix.api.utils.common import iso_to_clear_date
+from topix.api.utils.common import now_to_clear_date
 
 
 class TopicSetupInput(BaseModel):
@@ -36,7 +34,7 @@ class TopicSetup(BaseAgent):
         name = "Topic Setup"
         instructions = self._render_prompt(
             instructions_template,
-            time=iso_to_clear_date(datetime.now().isoformat()),
+            time=now_to_clear_date(),
         )
 
         web_search = web_search or WebSearchHandler.get_openai_web_tool()
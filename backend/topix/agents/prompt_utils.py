@@ -1,5 +1,6 @@
 """Prompt loading functions."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Template
@@ -13,8 +14,25 @@ def load_prompt(filename: str) -> str:
         return f.read()
 
 
+@lru_cache(maxsize=256)
+def load_template(filename: str) -> Template:
+    """Load and compile a prompt template, once per filename.
+
+    Prompt files ship with the package and do not change at runtime, so the
+    compiled template is reused by every later render.
+    """
+    return Template(load_prompt(filename))
+
+
+@lru_cache(maxsize=256)
+def _render_static_prompt(filename: str) -> str:
+    """Render a prompt template that takes no parameters, once per filename."""
+    return load_template(filename).render()
+
+
 def render_prompt(filename: str, **kwargs) -> str:
     """Render a prompt template with the given parameters."""
-    template_str = load_prompt(filename)
-    template = Template(template_str)
-    return template.render(**kwargs)
+    if not kwargs:
+        # Agents without template inputs render the same system prompt on every construction.
+        return _render_static_prompt(filename)
+    return load_template(filename).render(**kwargs)
@@ -3,6 +3,7 @@
 import functools
 import inspect
 import json
+import time
 import traceback
 
 from typing import Any, Awaitable, Callable, Type
@@ -41,6 +42,16 @@ from topix.utils.common import gen_uid
 
 RAW_RESPONSE_EVENT = "raw_response_event"
 
+# Raw response delta events streamed as tokens, looked up by exact event class.
+STREAM_DELTA_MESSAGE_TYPES = {
+    ResponseTextDeltaEvent: StreamingMessageType.STREAM_MESSAGE,
+    ResponseReasoningSummaryTextDeltaEvent: StreamingMessageType.STREAM_REASONING_MESSAGE,
+}
+
+# Streamed token deltas are batched into one message per this many characters or seconds.
+STREAM_FLUSH_CHARS = 64
+STREAM_FLUSH_INTERVAL_SECONDS = 0.02
+
 
 class ToolHandler:
     """Convert agent/function as FunctionTool object."""
@@ -423,6 +434,10 @@ class ToolHandler:
     ) -> None:
         """Process the streaming response from the LLM.
 
+        Token deltas are batched per `STREAM_FLUSH_CHARS` / `STREAM_FLUSH_INTERVAL_SECONDS`
+        to keep the number of queued messages down. Pending text is flushed before any
+        other stream event and when the stream ends or fails.
+
         Args:
             context: The context for the agent.
             stream_response: The streaming response from the LLM from Runner.run_streamed
@@ -430,34 +445,58 @@ class ToolHandler:
             tool_name: The name of the tool.
 
         """
-        event_type_map = {
-            ResponseTextDeltaEvent: StreamingMessageType.STREAM_MESSAGE,
-            ResponseReasoningSummaryTextDeltaEvent: StreamingMessageType.STREAM_REASONING_MESSAGE,
-        }
-
-        async for event in stream_response.stream_events():
-            if event.type == RAW_RESPONSE_EVENT:
-                for cls, msg_type in event_type_map.items():
-                    if isinstance(event.data, cls):
-                        msg = AgentStreamMessage(
-                            type=msg_type,
-                            content=Content(
-                                type=ContentType.TOKEN, text=event.data.delta
-                            ),
-                            tool_id=tool_id,
-                            tool_name=tool_name,
-                            is_stop=False,
-                        )
-                        await context._message_queue.put(msg)
+        buffer: list[str] = []
+        buffer_len = 0
+        buffer_type: StreamingMessageType | None = None
+        last_flush = time.monotonic()
+
+        async def flush() -> None:
+            nonlocal buffer_len, last_flush
+            if buffer:
+                msg = AgentStreamMessage(
+                    type=buffer_type,
+                    content=Content(
+                        type=ContentType.TOKEN, text="".join(buffer)
+                    ),
+                    tool_id=tool_id,
+                    tool_name=tool_name,
+                    is_stop=False,
+                )
+                buffer.clear()
+                buffer_len = 0
+                await context._message_queue.put(msg)
+            last_flush = time.monotonic()
+
+        try:
+            async for event in stream_response.stream_events():
+                msg_type = None
+                if event.type == RAW_RESPONSE_EVENT:
+                    msg_type = STREAM_DELTA_MESSAGE_TYPES.get(type(event.data))
+                if msg_type is None:
+                    # Anything else (tool calls, new items...) may take a while: send pending text first.
+                    await flush()
+                    continue
+
+                # Keep text and reasoning deltas in their original order.
+                if msg_type != buffer_type:
+                    await flush()
+                    buffer_type = msg_type
+                buffer.append(event.data.delta)
+                buffer_len += len(event.data.delta)
+                if (
+                    buffer_len >= STREAM_FLUSH_CHARS
+                    or time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS
+                ):
+                    await flush()
+        finally:
+            # Also on errors (e.g. max turns exceeded), text already received is still delivered.
+            await flush()
 
     @classmethod
     def _extract_thoughts(cls, response: RunResult | RunResultStreaming) -> str:
-        thought = ""
-        for raw_response in response.raw_responses:
-            for message in raw_response.output:
-                if message.type == "reasoning":
-                    if message.summary:
-                        thought += "\n\n".join(
-                            summary.text for summary in message.summary
-                        )
-        return thought
+        return "".join(
+            "\n\n".join(summary.text for summary in message.summary)
+            for raw_response in response.raw_responses
+            for message in raw_response.output
+            if message.type == "reasoning" and message.summary
+        )
@@ -2,6 +2,10 @@
 import re
 
 MIN_MATCHES = 10
+HTTP_LINK_RE = re.compile(r'(https?://[^\s()<>\[\]]*)')
+# Matches <| ... |> where inside starts with F or f
+FINAL_MARKER_RE = re.compile(r"<\|\s*[Ff][^|]*\|>")
+MARKER_RE = re.compile(r"<\|[^|]*\|>")
 
 
 def extract_final_answer(text: str) -> str:
@@ -20,9 +24,7 @@ def extract_final_answer(text: str) -> str:
         returns the full cleaned text.
 
     """
-    # Regex: match <| ... |> where inside starts with F or f
-    first_marker = re.compile(r"<\|\s*[Ff][^|]*\|>")
-    match = first_marker.search(text)
+    match = FINAL_MARKER_RE.search(text)
 
     if not match:
         # No final marker found: clean whole text
@@ -33,7 +35,7 @@ def extract_final_answer(text: str) -> str:
         result = text[start_index:]
 
     # Remove any other <|...|> markers
-    result = re.sub(r"<\|[^|]*\|>", "", result)
+    result = MARKER_RE.sub("", result)
 
     # Strip leading/trailing whitespace
     return result.strip()
@@ -42,6 +44,9 @@ def extract_final_answer(text: str) -> str:
 def post_process_url_citations(answer: str, valid_urls: list[str]) -> str:
     """Post process url citations to correct wrong urls."""
     valid_url_set = set(valid_urls)
+    if not valid_url_set or "http" not in answer:
+        # Nothing to correct against, or no url to correct: the answer is returned unchanged.
+        return answer
 
     trie = _create_trie(valid_url_set)
 
@@ -60,9 +65,7 @@ def post_process_url_citations(answer: str, valid_urls: list[str]) -> str:
         else:
             return extracted_url
 
-    http_link_regex = r'(https?://[^\s()<>\[\]]*)'
-
-    corrected_answer = re.sub(http_link_regex, replacer, answer)
+    corrected_answer = HTTP_LINK_RE.sub(replacer, answer)
     return corrected_answer
 
 
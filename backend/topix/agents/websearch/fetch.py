@@ -4,7 +4,7 @@ from agents import RunContextWrapper
 from topix.agents.datatypes.context import Context
 from topix.agents.datatypes.tools import AgentToolName, tool_descriptions
 from topix.agents.tool_handler import ToolHandler
-from topix.agents.websearch.tools import fetch_content
+from topix.agents.websearch.tools import fetch_content, web_search_cache
 
 MAX_FETCH_CONTENT_CHARS = 20_000
 
@@ -33,7 +33,11 @@ async def fetch_url(
 
     """
     try:
-        content = await fetch_content(url, extract_depth="basic")
+        # Pages fetched again within the web search cache TTL reuse the extracted content.
+        content = await web_search_cache.get_or_run(
+            (AgentToolName.NAVIGATE, url, "basic"),
+            lambda: fetch_content(url, extract_depth="basic"),
+        )
         content = _truncate_content(str(content))
         return (
             f"<UrlContent"
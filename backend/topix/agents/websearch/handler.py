@@ -11,11 +11,18 @@ from topix.agents.datatypes.tools import AgentToolName
 from topix.agents.datatypes.web_search import WebSearchContextSize, WebSearchOption
 from topix.agents.tool_handler import ToolHandler
 from topix.agents.websearch.openai import OpenAIWebSearch
-from topix.agents.websearch.tools import search_exa, search_linkup, search_perplexity, search_tavily
+from topix.agents.websearch.tools import search_exa, search_linkup, search_perplexity, search_tavily, web_search_cache
 from topix.agents.websearch.web_summarize import WebSummarize
 from topix.datatypes.recurrence import Recurrence
 from topix.utils.common import gen_uid
 
+SEARCH_FUNCS = {
+    WebSearchOption.TAVILY: search_tavily,
+    WebSearchOption.LINKUP: search_linkup,
+    WebSearchOption.PERPLEXITY: search_perplexity,
+    WebSearchOption.EXA: search_exa,
+}
+
 
 class WebSearchHandler:
     """Web Search Handler."""
@@ -101,30 +108,27 @@ class WebSearchHandler:
         timeout: httpx.Timeout | None = None,
     ) -> FunctionTool:
         """Get the normal web search tools."""
+        search_func = SEARCH_FUNCS.get(search_engine)
+        if search_func is None:
+            raise ValueError(f"Unknown search engine: {search_engine}")
 
         async def web_search(
             wrapper: RunContextWrapper[Context],
             query: str,
         ) -> WebSearchOutput:
-            match search_engine:
-                case WebSearchOption.TAVILY:
-                    search_func = search_tavily
-                case WebSearchOption.LINKUP:
-                    search_func = search_linkup
-                case WebSearchOption.PERPLEXITY:
-                    search_func = search_perplexity
-                case WebSearchOption.EXA:
-                    search_func = search_exa
-                case _:
-                    raise ValueError(f"Unknown search engine: {search_engine}")
-
-            res: WebSearchOutput = await search_func(
-                query=query,
-                max_results=max_results,
-                search_context_size=search_context_size,
-                recency=recency,
-                client=client,
-                timeout=timeout,
+            # Identical searches within the cache TTL share one upstream request, made
+            # with this tool's `client`.
+            key = (search_engine, query.strip().lower(), max_results, search_context_size, recency)
+            res: WebSearchOutput = await web_search_cache.get_or_run(
+                key,
+                lambda: search_func(
+                    query=query,
+                    max_results=max_results,
+                    search_context_size=search_context_size,
+                    recency=recency,
+                    client=client,
+                    timeout=timeout,
+                ),
             )
             return res
 
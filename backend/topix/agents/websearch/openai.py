@@ -1,6 +1,6 @@
 """Web Search Agent using Openai Default Web Search Tool."""
 
-import datetime
+from functools import lru_cache
 
 from agents import ModelSettings, RunResult, RunResultStreaming, WebSearchTool
 
@@ -9,10 +9,16 @@ from topix.agents.datatypes.context import Context
 from topix.agents.datatypes.model_enum import ModelEnum
 from topix.agents.datatypes.outputs import SearchResult, WebSearchOutput
 from topix.agents.datatypes.web_search import WebSearchContextSize
-from topix.api.utils.common import iso_to_clear_date
+from topix.api.utils.common import now_to_clear_date
 from topix.datatypes.recurrence import Recurrence
 
 
+@lru_cache(maxsize=32)
+def _render_web_search_instructions(instructions_template: str, time: str) -> str:
+    """Render the web search system prompt once per template and minute-resolution time."""
+    return OpenAIWebSearch._render_prompt(instructions_template, time=time)
+
+
 class OpenAIWebSearch(BaseAgent):
     """Web Search Agent using WebSearchTool from openai.
 
@@ -31,10 +37,10 @@ class OpenAIWebSearch(BaseAgent):
         name = "OpenAI Web Search"
 
         # Enhanced instructions that include citation requirements
-        instructions_dict = {
-            "time": iso_to_clear_date(datetime.datetime.now().isoformat()),
-        }
-        instructions = self._render_prompt(instructions_template, **instructions_dict)
+        instructions = _render_web_search_instructions(
+            instructions_template,
+            now_to_clear_date(),
+        )
         # Configure tools based on search engine
         tools = [WebSearchTool(search_context_size=search_context_size)]
 
@@ -56,20 +62,16 @@ class OpenAIWebSearch(BaseAgent):
         context: Context,
         output: RunResult | RunResultStreaming,
     ) -> WebSearchOutput:
-        existing_urls = set()
-        search_results: list[SearchResult] = []
-        # Extract citations from the final output
-        for item in output.new_items:
-            if item.type == "message_output_item":
-                for annotation in item.raw_item.content[0].annotations:
-                    if annotation.type == "url_citation":
-                        if annotation.url not in existing_urls:
-                            existing_urls.add(annotation.url)
-                            search_results.append(
-                                SearchResult(url=annotation.url, title=annotation.title)
-                            )
+        # Extract citations from the final output, keeping the first one per URL
+        results_by_url: dict[str, SearchResult] = {}
+        messages = (item for item in output.new_items if item.type == "message_output_item")
+        for item in messages:
+            annotations = item.raw_item.content[0].annotations
+            for annotation in annotations:
+                if annotation.type == "url_citation" and annotation.url not in results_by_url:
+                    results_by_url[annotation.url] = SearchResult(url=annotation.url, title=annotation.title)
 
         output = WebSearchOutput(
-            answer=output.final_output, search_results=search_results
+            answer=output.final_output, search_results=list(results_by_url.values())
         )
         return output
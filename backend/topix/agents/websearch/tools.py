@@ -1,9 +1,15 @@
-"""Tools for searching the web (async httpx version)."""
+"""Tools for searching the web (async httpx version).
+
+Provider results are parsed JSON with known fields, so `SearchResult` objects are
+built with `model_construct` and skip per-field validation.
+"""
 
 import asyncio
 import os
 
-from typing import Literal, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Literal, Mapping, Optional
 
 import httpx
 
@@ -12,10 +18,85 @@ from topix.agents.datatypes.outputs import WebSearchOutput
 from topix.agents.datatypes.web_search import WebSearchContextSize
 from topix.agents.websearch.utils import get_from_date
 from topix.datatypes.recurrence import Recurrence
+from topix.utils.cache import AsyncTTLCache
 from topix.utils.retry import async_retry
 
 semaphore = asyncio.Semaphore(100)  # limit concurrent requests to 100
 
+WEB_SEARCH_CACHE_TTL_SECONDS = 60
+WEB_SEARCH_CACHE_MAX_ENTRIES = 1024
+# Shared by the web search and navigate tools; every caller gets its own copy of the
+# output, since tools fill in `answer` afterwards.
+web_search_cache: AsyncTTLCache[WebSearchOutput] = AsyncTTLCache(
+    WEB_SEARCH_CACHE_TTL_SECONDS,
+    WEB_SEARCH_CACHE_MAX_ENTRIES,
+    copy=lambda output: output.model_copy(deep=True),
+)
+
+PERPLEXITY_SEARCH_URL = "https://api.perplexity.ai/search"
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+TAVILY_EXTRACT_URL = "https://api.tavily.com/extract"
+LINKUP_SEARCH_URL = "https://api.linkup.so/v1/search"
+EXA_SEARCH_URL = "https://api.exa.ai/search"
+
+DEFAULT_PERPLEXITY_TOKENS_PER_PAGE = 1024
+PERPLEXITY_TOKENS_PER_PAGE = {
+    WebSearchContextSize.LOW: 512,
+    WebSearchContextSize.MEDIUM: 1200,
+    WebSearchContextSize.HIGH: 2000,
+}
+
+SHARED_CLIENT_TIMEOUT = httpx.Timeout(30.0)
+_shared_client: httpx.AsyncClient | None = None
+_shared_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP/2 client used when a search is called without one.
+
+    Reusing one client keeps TLS sessions and keep-alive connections to the
+    search providers across calls. Connections are bound to an event loop, so
+    a new client is created if the running loop changed.
+    """
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            timeout=SHARED_CLIENT_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared search client, if one was created."""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
+
+
+async def _post(
+    url: str,
+    headers: Mapping[str, str],
+    data: dict,
+    *,
+    client: Optional[httpx.AsyncClient] = None,
+    timeout: Optional[httpx.Timeout] = None,
+) -> httpx.Response:
+    """POST a search request, bounded by the module semaphore."""
+    client = client or get_shared_client()
+    async with semaphore:
+        return await client.post(
+            url,
+            headers=headers,
+            json=data,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        )
+
 
 def _get_env_or_raise(key: str) -> str:
     value = os.environ.get(key)
@@ -27,6 +108,14 @@ def _get_env_or_raise(key: str) -> str:
     return value
 
 
+@lru_cache(maxsize=16)
+def _json_headers(api_key: str, auth: Literal["bearer", "x-api-key"] = "bearer") -> Mapping[str, str]:
+    """Return read-only JSON request headers for an API key, built once per key."""
+    if auth == "x-api-key":
+        return MappingProxyType({"Content-Type": "application/json", "x-api-key": api_key})
+    return MappingProxyType({"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"})
+
+
 @async_retry(retries=3, delay_ms=1000, exceptions=(httpx.HTTPError,))
 async def search_perplexity(
     query: str,
@@ -44,28 +133,17 @@ async def search_perplexity(
         max_results: Maximum number of results to return.
         search_context_size: Size of the search context.
         recency: Optional Recurrence filter. Returns results from the last 'daily', 'weekly', 'monthly', or 'yearly'.
-        client: Optional shared httpx.AsyncClient to reuse.
-        timeout: Optional httpx timeout (per-request).
+        client: Optional httpx.AsyncClient to use, defaults to `get_shared_client()`.
+        timeout: Optional httpx timeout (per-request), defaults to the client's timeout.
 
     Returns:
         WebSearchOutput
 
     """
-    url = "https://api.perplexity.ai/search"
-    api_key = _get_env_or_raise("PERPLEXITY_API_KEY")
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
+    url = PERPLEXITY_SEARCH_URL
+    headers = _json_headers(_get_env_or_raise("PERPLEXITY_API_KEY"))
 
-    tokens_per_page = 1024  # default value
-    match search_context_size:
-        case WebSearchContextSize.LOW:
-            tokens_per_page = 512
-        case WebSearchContextSize.MEDIUM:
-            tokens_per_page = 1200
-        case WebSearchContextSize.HIGH:
-            tokens_per_page = 2000
+    tokens_per_page = PERPLEXITY_TOKENS_PER_PAGE.get(search_context_size, DEFAULT_PERPLEXITY_TOKENS_PER_PAGE)
 
     data = {
         "query": query,
@@ -87,12 +165,7 @@ async def search_perplexity(
                 raise ValueError(f"Invalid recency: {recency}. Must be one of 'daily', 'weekly', 'monthly', 'yearly'.")
         data["search_recency_filter"] = recency_filter
 
-    async with semaphore:
-        if client is None:
-            async with httpx.AsyncClient() as ac:
-                resp = await ac.post(url, headers=headers, json=data, timeout=timeout)
-        else:
-            resp = await client.post(url, headers=headers, json=data, timeout=timeout)
+    resp = await _post(url, headers, data, client=client, timeout=timeout)
 
     resp.raise_for_status()
     json_response = resp.json()
@@ -100,7 +173,7 @@ async def search_perplexity(
 
     return WebSearchOutput(
         search_results=[
-            SearchResult(
+            SearchResult.model_construct(
                 url=result["url"],
                 title=result.get("title", ""),
                 content=result.get("snippet", ""),
@@ -128,19 +201,15 @@ async def search_tavily(
         search_context_size: Size of the search context.
         recency: Optional Recurrence filter. Returns results from the last 'daily', 'weekly', 'monthly', or 'yearly'.
             If not specified, no date filtering will be applied. Default is None (i.e., no filtering).
-        client: Optional shared httpx.AsyncClient to reuse.
-        timeout: Optional httpx timeout (per-request).
+        client: Optional httpx.AsyncClient to use, defaults to `get_shared_client()`.
+        timeout: Optional httpx timeout (per-request), defaults to the client's timeout.
 
     Returns:
         WebSearchOutput
 
     """
-    url = "https://api.tavily.com/search"
-    api_key = _get_env_or_raise("TAVILY_API_KEY")
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
+    url = TAVILY_SEARCH_URL
+    headers = _json_headers(_get_env_or_raise("TAVILY_API_KEY"))
 
     search_depth = "advanced" if search_context_size in (
         WebSearchContextSize.MEDIUM,
@@ -158,12 +227,7 @@ async def search_tavily(
         from_date = get_from_date(recency).isoformat()
         data["start_date"] = from_date
 
-    async with semaphore:
-        if client is None:
-            async with httpx.AsyncClient() as ac:
-                resp = await ac.post(url, headers=headers, json=data, timeout=timeout)
-        else:
-            resp = await client.post(url, headers=headers, json=data, timeout=timeout)
+    resp = await _post(url, headers, data, client=client, timeout=timeout)
 
     resp.raise_for_status()
     json_response = resp.json()
@@ -171,7 +235,7 @@ async def search_tavily(
 
     return WebSearchOutput(
         search_results=[
-            SearchResult(
+            SearchResult.model_construct(
                 url=result["url"],
                 title=result.get("title", ""),
                 content=result.get("content", ""),
@@ -199,19 +263,15 @@ async def search_linkup(
         search_context_size: Size of the search context.
         recency: Optional Recurrence filter. Returns results from the last 'daily', 'weekly', 'monthly', or 'yearly'.
             If not specified, no date filtering will be applied. Default is None (i.e., no filtering).
-        client: Optional shared httpx.AsyncClient to reuse.
-        timeout: Optional httpx timeout (per-request).
+        client: Optional httpx.AsyncClient to use, defaults to `get_shared_client()`.
+        timeout: Optional httpx timeout (per-request), defaults to the client's timeout.
 
     Returns:
         WebSearchOutput
 
     """
-    url = "https://api.linkup.so/v1/search"
-    api_key = _get_env_or_raise("LINKUP_API_KEY")
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
+    url = LINKUP_SEARCH_URL
+    headers = _json_headers(_get_env_or_raise("LINKUP_API_KEY"))
 
     # Use enum to determine depth (fixing prior string comparison)
     depth = "deep" if search_context_size == WebSearchContextSize.HIGH else "standard"
@@ -226,12 +286,7 @@ async def search_linkup(
         from_date = get_from_date(recency).isoformat()
         data["fromDate"] = from_date
 
-    async with semaphore:
-        if client is None:
-            async with httpx.AsyncClient() as ac:
-                resp = await ac.post(url, headers=headers, json=data, timeout=timeout)
-        else:
-            resp = await client.post(url, headers=headers, json=data, timeout=timeout)
+    resp = await _post(url, headers, data, client=client, timeout=timeout)
 
     resp.raise_for_status()
     json_response = resp.json()
@@ -239,7 +294,7 @@ async def search_linkup(
 
     return WebSearchOutput(
         search_results=[
-            SearchResult(
+            SearchResult.model_construct(
                 url=result["url"],
                 title=result.get("name", ""),
                 content=result.get("content", ""),
@@ -269,21 +324,16 @@ async def search_exa(
             everything else uses "auto" (fast + neural combo).
         recency: Optional Recurrence filter. Returns results from the last 'daily',
             'weekly', 'monthly', or 'yearly'. If not specified, no date filtering.
-        client: Optional shared httpx.AsyncClient to reuse.
-        timeout: Optional httpx timeout (per-request).
+        client: Optional httpx.AsyncClient to use, defaults to `get_shared_client()`.
+        timeout: Optional httpx timeout (per-request), defaults to the client's timeout.
 
     Returns:
         WebSearchOutput
 
     """
-    url = "https://api.exa.ai/search"
-    api_key = _get_env_or_raise("EXA_API_KEY")
-
+    url = EXA_SEARCH_URL
     # Exa supports x-api-key or Authorization: Bearer
-    headers = {
-        "Content-Type": "application/json",
-        "x-api-key": api_key,
-    }
+    headers = _json_headers(_get_env_or_raise("EXA_API_KEY"), auth="x-api-key")
 
     # Map your context size to Exa search type
     # HIGH -> "deep" (more comprehensive)
@@ -310,12 +360,7 @@ async def search_exa(
         from_date = get_from_date(recency).isoformat()
         data["startPublishedDate"] = from_date
 
-    async with semaphore:
-        if client is None:
-            async with httpx.AsyncClient() as ac:
-                resp = await ac.post(url, headers=headers, json=data, timeout=timeout)
-        else:
-            resp = await client.post(url, headers=headers, json=data, timeout=timeout)
+    resp = await _post(url, headers, data, client=client, timeout=timeout)
 
     resp.raise_for_status()
     json_response = resp.json()
@@ -331,7 +376,7 @@ async def search_exa(
         )
 
         search_results.append(
-            SearchResult(
+            SearchResult.model_construct(
                 url=result["url"],
                 title=result.get("title", ""),
                 content=content,
@@ -357,32 +402,22 @@ async def fetch_content(
     Args:
         web_url: The URL to read.
         extract_depth: "basic" or "advanced".
-        client: Optional shared httpx.AsyncClient to reuse.
-        timeout: Optional httpx timeout (per-request).
+        client: Optional httpx.AsyncClient to use, defaults to `get_shared_client()`.
+        timeout: Optional httpx timeout (per-request), defaults to the client's timeout.
 
     Returns:
         str: An XML-ish string containing the raw content.
 
     """
-    url = "https://api.tavily.com/extract"
-    api_key = _get_env_or_raise("TAVILY_API_KEY")
-
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}",
-    }
+    url = TAVILY_EXTRACT_URL
+    headers = _json_headers(_get_env_or_raise("TAVILY_API_KEY"))
 
     data = {
         "urls": web_url,          # kept consistent with your original code
         "extract_depth": extract_depth,
     }
 
-    async with semaphore:
-        if client is None:
-            async with httpx.AsyncClient() as ac:
-                resp = await ac.post(url, headers=headers, json=data, timeout=timeout)
-        else:
-            resp = await client.post(url, headers=headers, json=data, timeout=timeout)
+    resp = await _post(url, headers, data, client=client, timeout=timeout)
 
     resp.raise_for_status()
     raw_content = resp.json().get("results", [{}])[0].get("raw_content", "")
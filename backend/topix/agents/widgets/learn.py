@@ -7,10 +7,13 @@ from topix.agents.datatypes.tools import AgentToolName, tool_descriptions
 from topix.agents.prompt_utils import render_prompt
 from topix.agents.tool_handler import ToolHandler
 
+# The guidance takes no parameters, so it is rendered once at import.
+LEARN_GENERATE_HTML_WIDGET_GUIDANCE = render_prompt("widget/learn_generate_html_widget.jinja")
+
 
 async def learn_generate_html_widget(_wrapper: RunContextWrapper[Context]) -> str:
     """Load guidance for generating HTML widget notes."""
-    return render_prompt("widget/learn_generate_html_widget.jinja")
+    return LEARN_GENERATE_HTML_WIDGET_GUIDANCE
 
 
 learn_generate_html_widget_tool = ToolHandler.convert_func_to_tool(
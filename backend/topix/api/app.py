@@ -11,7 +11,9 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from topix.agents.websearch.tools import close_shared_client
 from topix.api.router import billing, boards, chats, documents, files, finance, subscriptions, tools, users, utils
+from topix.api.utils.rate_limit.cache import ExhaustedQuotaCache
 from topix.config.config import Config
 from topix.datatypes.stage import StageEnum
 from topix.nlp.pipeline.parsing import ParsingPipeline
@@ -51,6 +53,7 @@ def create_app(stage: StageEnum):
 
         # Initialize Redis
         app.redis_store = RedisStore.from_config()
+        app.rate_limit_cache = ExhaustedQuotaCache()
 
         yield
 
@@ -63,6 +66,8 @@ def create_app(stage: StageEnum):
         await app.subscription_store.close()
         # Close Redis
         await app.redis_store.close()
+        # Close the pooled web search client
+        await close_shared_client()
 
     app = FastAPI(lifespan=lifespan)
 
@@ -128,4 +133,5 @@ if __name__ == "__main__":
     host = "0.0.0.0"
     logger.info(f"Starting Topix API on {host}:{port}...")
 
+    # The default "auto" loop runs on uvloop when it is installed (all platforms but Windows).
     uvicorn.run(app, host=host, port=port, log_level="info")
@@ -5,6 +5,7 @@ from datetime import timedelta
 from typing import Annotated
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 
 from topix.api.datatypes.requests import EmailVerificationRequest, GoogleSigninRequest, RefreshRequest, UserSignupRequest
@@ -120,7 +121,8 @@ async def google_signin(
             detail="Google connect is not available",
         )
 
-    payload = verify_google_id_token(body.id_token)
+    # Verification fetches Google's signing certs with a blocking HTTP call.
+    payload = await run_in_threadpool(verify_google_id_token, body.id_token)
     user_store: UserStore = request.app.user_store
     user = await user_store.get_user_by_google_sub(payload["sub"])
     if user is not None:
@@ -1,6 +1,16 @@
 """Common utility functions."""
 from datetime import datetime
 
+CLEAR_DATE_FORMAT = "%A, %B %d, %Y at %H:%M"
+
+
+def now_to_clear_date() -> str:
+    """Format the current local time like `iso_to_clear_date` does for a naive ISO date.
+
+    Formats the datetime directly instead of going through an ISO string round trip.
+    """
+    return datetime.now().strftime(CLEAR_DATE_FORMAT)
+
 
 def iso_to_clear_date(iso_date: str) -> str:
     """Convert an ISO 8601 date string to a clear, human-readable format with weekday.
@@ -18,13 +28,13 @@ def iso_to_clear_date(iso_date: str) -> str:
             dt = datetime.fromisoformat(iso_date)
 
         # Base readable format with weekday
-        readable = dt.strftime("%A, %B %d, %Y at %H:%M %Z")
+        readable = dt.strftime(f"{CLEAR_DATE_FORMAT} %Z")
 
         # Handle missing timezone names or offsets
         if not dt.tzinfo:
-            return dt.strftime("%A, %B %d, %Y at %H:%M")
+            return dt.strftime(CLEAR_DATE_FORMAT)
         elif not dt.tzname():
-            return f"{dt.strftime('%A, %B %d, %Y at %H:%M')} UTC{dt.strftime('%z')}"
+            return f"{dt.strftime(CLEAR_DATE_FORMAT)} UTC{dt.strftime('%z')}"
 
         return readable
     except ValueError:
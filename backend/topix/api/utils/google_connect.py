@@ -6,6 +6,9 @@ from google.oauth2 import id_token as google_id_token
 
 from topix.api.utils.auth_methods import get_google_client_id
 
+# One transport for all verifications, so the HTTP session to Google's cert endpoint is reused.
+_google_request = google_requests.Request()
+
 
 def verify_google_id_token(id_token: str) -> dict:
     """Verify a Google ID token and return its decoded claims."""
@@ -19,7 +22,7 @@ def verify_google_id_token(id_token: str) -> dict:
     try:
         payload = google_id_token.verify_oauth2_token(
             id_token,
-            google_requests.Request(),
+            _google_request,
             client_id,
         )
     except ValueError as exc:
@@ -0,0 +1,53 @@
+"""Per-process cache of exhausted quotas.
+
+Fixed and cycle windows only ever count up until they reset, so once Redis
+reports a quota as exceeded the answer stays the same until `retry_after`
+elapses. Remembering that locally lets repeated requests from a throttled
+user be rejected without a Redis round trip.
+"""
+
+import time
+
+from topix.api.utils.rate_limit.types import RateLimitRule
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class ExhaustedQuotaCache:
+    """Remember quota rules a user has exhausted until their window resets."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Init method."""
+        self.max_entries = max_entries
+        self._expires_at: dict[tuple[str, str, str, int], float] = {}
+
+    @staticmethod
+    def _key(user_uid: str, rule: RateLimitRule) -> tuple[str, str, str, int]:
+        # The limit is part of the key so a plan change is not masked by a stale entry.
+        return (user_uid, rule.scope, rule.name, rule.limit)
+
+    def retry_after(self, user_uid: str, rule: RateLimitRule) -> int | None:
+        """Return seconds left on a cached exhausted quota, or None if not cached."""
+        key = self._key(user_uid, rule)
+        expires_at = self._expires_at.get(key)
+        if expires_at is None:
+            return None
+
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            del self._expires_at[key]
+            return None
+        return max(int(remaining), 1)
+
+    def mark_exhausted(self, user_uid: str, rule: RateLimitRule, retry_after: int) -> None:
+        """Record that the rule is exhausted for `retry_after` seconds."""
+        if len(self._expires_at) >= self.max_entries:
+            self._evict()
+        self._expires_at[self._key(user_uid, rule)] = time.monotonic() + retry_after
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones if still full."""
+        now = time.monotonic()
+        self._expires_at = {key: exp for key, exp in self._expires_at.items() if exp > now}
+        while len(self._expires_at) >= self.max_entries:
+            del self._expires_at[next(iter(self._expires_at))]
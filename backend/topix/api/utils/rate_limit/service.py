@@ -2,6 +2,7 @@
 
 from fastapi import Request
 
+from topix.api.utils.rate_limit.cache import ExhaustedQuotaCache
 from topix.api.utils.rate_limit.entitlements import resolve_entitlement_context
 from topix.api.utils.rate_limit.errors import raise_rate_limit_exceeded
 from topix.api.utils.rate_limit.policy import build_rate_limit_rules
@@ -13,6 +14,14 @@ async def enforce_rate_limit(request: Request, user_uid: str) -> None:
     redis: RedisStore = request.app.redis_store
     entitlement = await resolve_entitlement_context(request, user_uid)
     rules = build_rate_limit_rules(entitlement)
+    exhausted: ExhaustedQuotaCache | None = getattr(request.app, "rate_limit_cache", None)
+
+    # Reject users with a known exhausted quota before touching any Redis counter.
+    if exhausted is not None:
+        for rule in rules:
+            cached_retry_after = exhausted.retry_after(user_uid, rule)
+            if cached_retry_after is not None:
+                raise_rate_limit_exceeded(rule, entitlement.plan, cached_retry_after)
 
     for rule in rules:
         if rule.kind == "fixed_utc":
@@ -41,4 +50,6 @@ async def enforce_rate_limit(request: Request, user_uid: str) -> None:
                 )
 
         if not allowed:
+            if exhausted is not None:
+                exhausted.mark_exhausted(user_uid, rule, retry_after)
             raise_rate_limit_exceeded(rule, entitlement.plan, retry_after)
@@ -162,8 +162,6 @@ async def run_agent_session(  # noqa: C901
     )
     context = ReasoningContext()
 
-    final_answer = ""
-
     try:
         async for msg in assistant.run_streamed(
             query=query, context=context, session=session
@@ -182,7 +180,6 @@ async def run_agent_session(  # noqa: C901
                 ):
                     continue
                 if msg.content and msg.content.text:
-                    final_answer += msg.content.text
                     # strip a leading echo of the query only on the first chunk
                     chunk = strip_query_echo_once(sess.answer, msg.content.text, query)
                     if chunk:
@@ -556,6 +553,14 @@ if __name__ == "__main__":
     mode, model, search_engine = _select_options()
 
     try:
-        asyncio.run(main_async(mode, model, search_engine))
+        # Same event loop as the API server: uvloop where it is installed (not on Windows).
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+
+    try:
+        run(main_async(mode, model, search_engine))
     except KeyboardInterrupt:
         console.print(Text("Bye-bye appli.", style="red"))
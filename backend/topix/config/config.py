@@ -9,11 +9,11 @@ from urllib.parse import quote_plus
 
 from http_exceptions.client_exceptions import BadRequestException, UnauthorizedException
 from pydantic import BaseModel, Field, SecretStr
-from yaml import safe_load
 
 from topix.config.utils import generate_jwt_secret, load_secrets
 from topix.datatypes.stage import StageEnum
-from topix.utils.singleton import SingletonMeta
+from topix.utils.common import load_yaml
+from topix.utils.singleton import SingletonMeta, SingletonNotInitializedError
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +78,7 @@ class RedisConfig(BaseModel):
     port: int = 6379
     db: int = 0
     password: SecretStr | None = None
+    max_connections: int = 64
 
     def model_post_init(self, __context):
         """Post-initialization to set up any derived attributes."""
@@ -284,10 +285,21 @@ class Config(BaseModel, metaclass=ConfigMeta):
         cls,
         stage: StageEnum = StageEnum.LOCAL
     ) -> Config:
-        """Load configuration from Doppler based on the provided stage."""
+        """Load configuration from Doppler based on the provided stage.
+
+        Loading is idempotent: once the config is initialized for a stage, the
+        existing instance is returned without fetching the secrets again.
+        """
+        try:
+            existing = cls.instance()
+        except SingletonNotInitializedError:
+            existing = None
+        if existing is not None and existing.stage == stage:
+            return existing
+
         try:
             secret = load_secrets(stage)
-            config_data = safe_load(secret)
+            config_data = load_yaml(secret)
         except BadRequestException as e:
             if hasattr(e, 'status_code') and e.status_code == 400:
                 logger.error(
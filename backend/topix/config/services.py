@@ -7,10 +7,10 @@ from enum import StrEnum
 from pathlib import Path
 from typing import Literal
 
-import yaml
-
 from pydantic import BaseModel
 
+from topix.utils.common import load_yaml
+
 logger = logging.getLogger(__name__)
 
 LLM_FILEPATH = Path(__file__).parent.parent / "llm_models.yml"
@@ -99,7 +99,7 @@ class ServiceConfig(BaseModel):
     def _sync(cls) -> dict:
         """Sync the services config with environment variables."""
         with open(SERVICES_FILEPATH) as f:
-            cf = yaml.safe_load(f)
+            cf = load_yaml(f)
 
         # Get valid providers:
         providers: list[str] = []
@@ -164,7 +164,7 @@ class ServiceConfig(BaseModel):
 
         """
         with open(LLM_FILEPATH) as f:
-            cf: list[dict] = yaml.safe_load(f)
+            cf: list[dict] = load_yaml(f)
 
         res = []
         for llm_name in llm_services:
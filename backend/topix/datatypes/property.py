@@ -7,7 +7,7 @@ import abc
 from enum import IntEnum, StrEnum
 from typing import Annotated, Literal, Type
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from topix.agents.datatypes.annotations import SearchResult
 from topix.agents.datatypes.reasoning_step import ReasoningStep
@@ -223,3 +223,6 @@ type DataProperty = Annotated[
     ),
     Field(discriminator="type")
 ]
+
+# Building the discriminated-union validator is the costly part, so do it once.
+DATA_PROPERTY_ADAPTER: TypeAdapter[DataProperty] = TypeAdapter(DataProperty)
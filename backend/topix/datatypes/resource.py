@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 
 from datetime import datetime
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
@@ -14,6 +15,12 @@ from topix.utils.common import gen_uid
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _type_adapter(annotation) -> TypeAdapter:
+    """Return a cached TypeAdapter for a field annotation."""
+    return TypeAdapter(annotation)
+
+
 class RichText(BaseModel):
     """Rich text object."""
 
@@ -68,7 +75,7 @@ class Resource(BaseModel):
                 logger.warning(f"Unknown field: {k}")
                 continue
             try:
-                adapter = TypeAdapter(cls.model_fields[k].annotation)
+                adapter = _type_adapter(cls.model_fields[k].annotation)
                 values[k] = adapter.validate_python(v)
             except Exception as e:
                 errors.append(f"Field '{k}': {e}")
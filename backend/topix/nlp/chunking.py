@@ -8,6 +8,8 @@ from topix.datatypes.file.chunk import Chunk, ChunkProperties
 from topix.datatypes.property import TextProperty
 from topix.datatypes.resource import RichText
 
+_TITLE_RE = re.compile(r"^#{1,6}\s")
+
 
 @dataclass
 class MarkdownLine:
@@ -55,8 +57,9 @@ class Chunker:
                 # Calculate char count
                 char_count = len(line)
 
-                # Detect if line is a title (starts with one or more # followed by space)
-                is_title = bool(re.match(r"^#{1,6}\s", line))
+                # Detect if line is a title (starts with one or more # followed by space);
+                # the startswith check keeps the regex off the common non-title lines
+                is_title = line.startswith("#") and _TITLE_RE.match(line) is not None
 
                 # Create MarkdownLine object
                 markdown_line = MarkdownLine(
@@ -15,9 +15,16 @@ from topix.utils.common import running_in_docker
 
 logger = logging.getLogger(__name__)
 
+# (stage, env filename) pairs already loaded in this process
+_loaded_env_files: set[tuple[StageEnum, str]] = set()
+
 
 def load_env_file(stage: StageEnum, env_filename: str = '.env') -> None:
-    """Load environment variables from a .env file."""
+    """Load environment variables from a .env file, once per stage and file."""
+    if (stage, env_filename) in _loaded_env_files:
+        return
+    _loaded_env_files.add((stage, env_filename))
+
     envpath = Path(__file__).parent.parent.parent / env_filename
     logger.info(f"Loading env from: {envpath}")
     load_dotenv(dotenv_path=envpath, override=True, verbose=True)
@@ -16,13 +16,12 @@ from topix.datatypes.note.note import Note
 from topix.store.note_revision import NoteRevisionStore, deserialize_note_snapshot
 from topix.store.postgres.graph import (
     _dangerous_hard_delete_graph_by_uid,
-    create_graph,
     delete_graph_by_uid,
     get_graph_by_uid,
     update_graph_by_uid,
 )
 from topix.store.postgres.graph_user import (
-    add_user_to_graph_by_uid,
+    create_graph_with_owner,
     get_graph_role_by_user_uid,
     list_graphs_by_user_uid,
 )
@@ -339,8 +338,7 @@ class GraphStore:
     async def add_graph(self, graph: Graph, user_uid: str) -> Graph:
         """Create a new graph."""
         async with self._pg_pool.acquire() as conn:
-            await create_graph(conn, graph)
-            await add_user_to_graph_by_uid(conn, graph.uid, user_uid, "owner")
+            await create_graph_with_owner(conn, graph, user_uid)
 
     async def update_graph(self, graph_uid: str, data: dict):
         """Update an existing graph."""
@@ -1,4 +1,6 @@
 """Graph User Base Postgres Store."""
+from datetime import datetime
+
 import asyncpg
 
 from topix.datatypes.graph.graph import Graph
@@ -6,6 +8,49 @@ from topix.store.postgres.graph import get_graph_id_by_uid
 from topix.store.postgres.user import get_user_id_by_uid
 
 
+async def create_graph_with_owner(
+    conn: asyncpg.Connection,
+    graph: Graph,
+    owner_uid: str,
+) -> Graph:
+    """Insert a graph and its owner association in a single statement.
+
+    The graph is only inserted when the owner exists, so a missing user
+    never leaves an orphan graph behind.
+    """
+    query = (
+        "WITH owner AS ("
+        "SELECT id FROM users WHERE uid = $9"
+        "), new_graph AS ("
+        "INSERT INTO graphs (uid, label, format_version, readonly, visibility, "
+        "created_at, updated_at, deleted_at) "
+        "SELECT $1, $2, $3, $4, $5, $6, $7, $8 FROM owner "
+        "RETURNING id"
+        "), owner_link AS ("
+        "INSERT INTO graph_user (graph_id, user_id, role) "
+        "SELECT new_graph.id, owner.id, 'owner' FROM new_graph, owner"
+        ") "
+        "SELECT id FROM new_graph"
+    )
+    graph_id = await conn.fetchval(
+        query,
+        graph.uid,
+        graph.label,
+        graph.format_version,
+        graph.readonly,
+        graph.visibility,
+        datetime.fromisoformat(graph.created_at) if graph.created_at else None,
+        datetime.fromisoformat(graph.updated_at) if graph.updated_at else None,
+        datetime.fromisoformat(graph.deleted_at) if graph.deleted_at else None,
+        owner_uid,
+    )
+    if graph_id is None:
+        raise ValueError(f"Invalid owner_uid: {owner_uid}")
+
+    graph.id = graph_id
+    return graph
+
+
 async def add_user_to_graph_by_uid(
     conn: asyncpg.Connection,
     graph_uid: str,
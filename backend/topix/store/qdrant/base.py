@@ -119,9 +119,9 @@ class QdrantStore:
         exists = await self.client.collection_exists(self.collection)
         if exists:
             await self.client.delete_collection(self.collection)
-            logger.info(f"Collection '{self.collection}' dropped.")
+            logger.info("Collection '%s' dropped.", self.collection)
         else:
-            logger.warning(f"Collection '{self.collection}' does not exist.")
+            logger.warning("Collection '%s' does not exist.", self.collection)
 
     async def _add_batch(
         self,
@@ -162,7 +162,7 @@ class QdrantStore:
         for i in range(0, len(objects), batch_size):
             batch = objects[i:i + batch_size]
             batch_embeddings = embeddings[i:i + batch_size] if embeddings else None
-            logger.info(f"Adding batch {i // batch_size + 1} of size {len(batch)}")
+            logger.info("Adding batch %d of size %d", i // batch_size + 1, len(batch))
             await self._add_batch(batch, batch_embeddings)
 
     async def update_fields(
@@ -312,7 +312,7 @@ class QdrantStore:
             collection_name=self.collection,
             points_selector=FilterSelector(filter=filters),
         )
-        logger.info(f"Deleted points matching filters: {filters}")
+        logger.info("Deleted points matching filters: %s", filters)
 
     async def close(self):
         """Close the Qdrant client connection."""
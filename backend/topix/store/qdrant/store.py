@@ -136,9 +136,9 @@ class ContentStore:
         exists = await self.client.collection_exists(self.collection)
         if exists:
             await self.client.delete_collection(self.collection)
-            logger.info(f"Collection '{self.collection}' dropped.")
+            logger.info("Collection '%s' dropped.", self.collection)
         else:
-            logger.warning(f"Collection '{self.collection}' does not exist.")
+            logger.warning("Collection '%s' does not exist.", self.collection)
 
     async def delete(
         self,
@@ -159,7 +159,7 @@ class ContentStore:
                 points_selector=ids,
                 wait=refresh,
             )
-        logger.info(f"Successfully deleted {len(ids)} data from the collection.")
+        logger.info("Successfully deleted %d data from the collection.", len(ids))
 
     async def delete_by_filters(
         self,
@@ -183,7 +183,7 @@ class ContentStore:
                     payload={"deleted_at": datetime.now().isoformat()},
                     points=point_ids,
                 )
-            logger.info(f"Successfully marked {len(point_ids)} data as deleted.")
+            logger.info("Successfully marked %d data as deleted.", len(point_ids))
         else:
             await self.client.delete(
                 collection_name=self.collection,
@@ -250,7 +250,7 @@ class ContentStore:
                     points=points,
                     wait=refresh,
                 )
-        logger.info(f"Added {len(resources)} data to the Qdrant store.")
+        logger.info("Added %d data to the Qdrant store.", len(resources))
 
     async def _update_payloads(
         self, ids: list[str | int], fields: list[dict], refresh: bool = False
@@ -311,7 +311,7 @@ class ContentStore:
 
             await self._update_payloads(batch_ids, batch_fields, refresh)
             await self._update_embs(batch_ids, batch_embeds)
-        logger.info(f"Updated {len(fields)} data in the Qdrant store.")
+        logger.info("Updated %d data in the Qdrant store.", len(fields))
 
     async def count(self, filter: Filter | None = None) -> int:
         """Count the number of objects in the collection."""
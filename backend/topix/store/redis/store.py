@@ -4,10 +4,34 @@ import time
 from datetime import datetime, timedelta, timezone
 from typing import Literal
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from topix.config.config import Config, RedisConfig
 
+# Sliding window check in one round trip: evict entries older than the window,
+# count what is left, then record the current request.
+# KEYS[1]: window key, ARGV[1]: now (seconds), ARGV[2]: window (seconds), ARGV[3]: member
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('EXPIRE', KEYS[1], window)
+return count
+"""
+
+# Fixed window counter in one round trip: increment, and set the TTL when the
+# window key is created so a crash between the two commands cannot leak it.
+# KEYS[1]: window key, ARGV[1]: TTL (seconds)
+FIXED_WINDOW_SCRIPT = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return current
+"""
+
 
 class RedisStore:
     """Manager for handling data in the Redis store."""
@@ -18,6 +42,9 @@ class RedisStore:
     ):
         """Init method."""
         self.redis = redis_client
+        # Registered scripts run through EVALSHA and reload themselves on NOSCRIPT
+        self._sliding_window_script = redis_client.register_script(SLIDING_WINDOW_SCRIPT)
+        self._fixed_window_script = redis_client.register_script(FIXED_WINDOW_SCRIPT)
 
     @classmethod
     def from_config(cls):
@@ -25,13 +52,17 @@ class RedisStore:
         config: Config = Config.instance()
         redis_config: RedisConfig = config.run.databases.redis
 
-        redis_client = Redis(
+        # One bounded pool shared by all requests; callers wait for a free
+        # connection instead of opening new sockets under bursts.
+        pool = BlockingConnectionPool(
             host=redis_config.host,
             port=redis_config.port,
             db=redis_config.db,
             password=redis_config.password.get_secret_value() if redis_config.password else None,
-            decode_responses=True
+            decode_responses=True,
+            max_connections=redis_config.max_connections,
         )
+        redis_client = Redis.from_pool(pool)
 
         return cls(redis_client=redis_client)
 
@@ -59,7 +90,6 @@ class RedisStore:
 
         """
         current_time = time.time()
-        window_start = current_time - window_seconds
 
         # Redis key for this user's rate limit
         if scope:
@@ -67,26 +97,11 @@ class RedisStore:
         else:
             key = f"rate_limit:{user_id}"
 
-        # Use Redis pipeline for atomic operations
-        pipe = self.redis.pipeline()
-
-        # Remove requests older than the window
-        pipe.zremrangebyscore(key, 0, window_start)
-
-        # Count requests in the current window
-        pipe.zcard(key)
-
-        # Add current request timestamp
-        pipe.zadd(key, {str(current_time): current_time})
-
-        # Set expiration to clean up old keys
-        pipe.expire(key, window_seconds)
-
-        # Execute pipeline
-        results = await pipe.execute()
-
-        # Get the count before adding the current request
-        request_count = results[1]
+        # Count requests in the window (before adding the current one) atomically
+        request_count = await self._sliding_window_script(
+            keys=[key],
+            args=[current_time, window_seconds, str(current_time)],
+        )
 
         return request_count < max_requests
 
@@ -120,6 +135,10 @@ class RedisStore:
             return now.strftime("%Y%m%d")
         return now.strftime("%Y%m")
 
+    async def _incr_window(self, key: str, ttl_seconds: int) -> int:
+        """Increment a window counter, setting its TTL on first use."""
+        return await self._fixed_window_script(keys=[key], args=[ttl_seconds])
+
     async def check_fixed_window_quota(
         self,
         user_id: str,
@@ -132,9 +151,7 @@ class RedisStore:
         key = f"quota:{scope}:{period}:{bucket}:{user_id}"
         retry_after = self._seconds_until_utc_reset(period)
 
-        current = await self.redis.incr(key)
-        if current == 1:
-            await self.redis.expire(key, retry_after)
+        current = await self._incr_window(key, retry_after)
 
         return current <= limit, retry_after
 
@@ -156,8 +173,6 @@ class RedisStore:
         end_key = end.strftime("%Y%m%dT%H%M%SZ")
         key = f"quota:{scope}:cycle:{start_key}:{end_key}:{user_id}"
 
-        current = await self.redis.incr(key)
-        if current == 1:
-            await self.redis.expire(key, retry_after)
+        current = await self._incr_window(key, retry_after)
 
         return current <= limit, retry_after
@@ -123,4 +123,5 @@ class SubscriptionStore:
 
     async def close(self):
         """Close the subscription store."""
+        await self._newsfeed_pipeline.aclose()
         await self._content_store.close()
@@ -0,0 +1,80 @@
+"""In-process TTL cache for async calls.
+
+Used by the web and image search tools: identical calls made while one is in
+flight share a single upstream request, and its result is then served from
+memory until it expires.
+"""
+
+import asyncio
+import time
+
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncTTLCache(Generic[T]):
+    """Cache async results for `ttl_seconds`, coalescing concurrent calls per key.
+
+    The first caller for a key starts the call as a shared task; later callers
+    await the same task. The task runs the first caller's factory, so whatever it
+    closes over (e.g. an httpx client) belongs to that caller: if that client is
+    closed while the call is in flight, every waiter gets the resulting error.
+    Waiters are shielded from each other's cancellation, so one caller going
+    away does not cancel the call for the others. Failed or cancelled calls are
+    not cached.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, copy: Callable[[T], T]):
+        """Init method.
+
+        Args:
+            ttl_seconds: How long a result is served from the cache.
+            max_entries: Maximum number of cached results.
+            copy: Applied to every returned result, so callers never share a mutable value.
+
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.copy = copy
+        self._entries: dict[Hashable, tuple[float, T]] = {}
+        self._inflight: dict[Hashable, asyncio.Task[T]] = {}
+
+    async def get_or_run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached result for `key`, or run `factory` (once for all concurrent callers)."""
+        cached = self._entries.get(key)
+        if cached is not None:
+            expires_at, value = cached
+            if expires_at > time.monotonic():
+                return self.copy(value)
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+
+        return self.copy(await asyncio.shield(task))
+
+    def clear(self) -> None:
+        """Drop all cached results; in-flight calls are left running."""
+        self._entries.clear()
+
+    def _store(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        """Cache the result of a finished call, failed or cancelled calls are not cached."""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        if len(self._entries) >= self.max_entries:
+            self._evict()
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, task.result())
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones if still full."""
+        now = time.monotonic()
+        self._entries = {key: entry for key, entry in self._entries.items() if entry[0] > now}
+        while len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
@@ -1,7 +1,13 @@
 """Common utility functions."""
 from pathlib import Path
+from typing import IO, Any
 from uuid import uuid4
 
+import yaml
+
+# libyaml's C parser when PyYAML was built with it (the PyPI wheels are), else the pure-Python one.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def gen_uid() -> str:
     """Generate a unique id string."""
@@ -11,3 +17,8 @@ def gen_uid() -> str:
 def running_in_docker() -> bool:
     """Check if the code is running inside a Docker container."""
     return Path("/.dockerenv").exists()
+
+
+def load_yaml(stream: str | IO) -> Any:
+    """Parse a YAML document with the safe loader, like `yaml.safe_load`."""
+    return yaml.load(stream, Loader=YAML_SAFE_LOADER)
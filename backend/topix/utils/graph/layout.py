@@ -1,6 +1,8 @@
 """IGraph-based graph layout utilities."""
 
+from collections.abc import Callable
 from enum import StrEnum
+from functools import lru_cache
 from typing import Annotated
 
 from igraph import Graph
@@ -52,14 +54,16 @@ def get_bounds(nodes: list[GraphNode]) -> dict[str, float]:
             "centerY": 0.0,
         }
 
-    min_x = min(_node_position(n).x for n in nodes)
-    min_y = min(_node_position(n).y for n in nodes)
-    max_x = max(
-        _node_position(n).x + _node_size(n).width for n in nodes
-    )
-    max_y = max(
-        _node_position(n).y + _node_size(n).height for n in nodes
-    )
+    # Single pass: resolve each node's position and size once
+    min_x = min_y = float("inf")
+    max_x = max_y = float("-inf")
+    for node in nodes:
+        pos = _node_position(node)
+        size = _node_size(node)
+        min_x = min(min_x, pos.x)
+        min_y = min(min_y, pos.y)
+        max_x = max(max_x, pos.x + size.width)
+        max_y = max(max_y, pos.y + size.height)
 
     center_x = (min_x + max_x) / 2
     center_y = (min_y + max_y) / 2
@@ -126,6 +130,37 @@ class LayoutDirection(StrEnum):
     RIGHT_LEFT = "RL"
 
 
+# Dagre-style direction transforms applied to Sugiyama (top-bottom) coordinates
+_DIRECTION_TRANSFORMS: dict[LayoutDirection, Callable[[float, float], tuple[float, float]]] = {
+    LayoutDirection.TOP_BOTTOM: lambda x, y: (x, y),
+    LayoutDirection.BOTTOM_TOP: lambda x, y: (x, -y),
+    LayoutDirection.LEFT_RIGHT: lambda x, y: (y, x),
+    LayoutDirection.RIGHT_LEFT: lambda x, y: (-y, x),
+}
+
+
+@lru_cache(maxsize=128)
+def _build_graph(nodes: tuple[str, ...], edges: tuple[tuple[str, str], ...]) -> Graph:
+    """Build (and cache) the directed igraph graph for a node/edge set.
+
+    Re-layouts of the same graph with a different direction or gap reuse the
+    cached graph and only rerun the Sugiyama pass.
+    """
+    # Build index lookup
+    index = {node: i for i, node in enumerate(nodes)}
+
+    # Convert edges to index pairs
+    edge_indices = []
+    for src, dst in edges:
+        if src not in index or dst not in index:
+            raise ValueError(f"Edge ({src} -> {dst}) references unknown node")
+        edge_indices.append((index[src], index[dst]))
+
+    g = Graph(n=len(nodes), edges=edge_indices, directed=True)
+    g.vs["name"] = list(nodes)
+    return g
+
+
 def layout_directed(
     nodes: list[str],
     edges: list[list[str]],
@@ -146,38 +181,17 @@ def layout_directed(
         dict[str, tuple[float, float]]: Mapping from node id to (x, y) position.
 
     """
-    # Build index lookup
-    index = {node: i for i, node in enumerate(nodes)}
-
-    # Convert edges to index pairs
-    edge_indices = []
-    for src, dst in edges:
-        if src not in index or dst not in index:
-            raise ValueError(f"Edge ({src} -> {dst}) references unknown node")
-        edge_indices.append((index[src], index[dst]))
+    transform = _DIRECTION_TRANSFORMS.get(direction)
+    if transform is None:
+        raise ValueError("direction must be one of: TB, BT, LR, RL")
 
-    # Build igraph graph
-    g = Graph(n=len(nodes), edges=edge_indices, directed=True)
-    g.vs["name"] = nodes
+    g = _build_graph(tuple(nodes), tuple((src, dst) for src, dst in edges))
 
     # Sugiyama (hierarchical) layout
     layout = g.layout_sugiyama(hgap=hgap, vgap=vgap)
-    coords = layout.coords  # list[(x, y)]
-
-    # Apply Dagre-style direction transform
-    if direction == LayoutDirection.TOP_BOTTOM:
-        pass
-    elif direction == LayoutDirection.BOTTOM_TOP:
-        coords = [(x, -y) for x, y in coords]
-    elif direction == LayoutDirection.LEFT_RIGHT:
-        coords = [(y, x) for x, y in coords]
-    elif direction == LayoutDirection.RIGHT_LEFT:
-        coords = [(-y, x) for x, y in coords]
-    else:
-        raise ValueError("direction must be one of: TB, BT, LR, RL")
 
     # Map node id -> position
     return {
-        nodes[i]: (coords[i][0], coords[i][1])
-        for i in range(len(nodes))
+        node: transform(x, y)
+        for node, (x, y) in zip(nodes, layout.coords)
     }
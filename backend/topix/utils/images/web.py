@@ -10,12 +10,20 @@ import httpx
 from topix.agents.datatypes.image import ImageSearchLocation
 from topix.agents.websearch.utils import get_from_date
 from topix.datatypes.recurrence import Recurrence
+from topix.utils.cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
 MAX_CONCURRENT_IMAGE_SEARCHES = 100
+DEFAULT_SEARCH_TIMEOUT = httpx.Timeout(5.0)
 semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGE_SEARCHES)
 
+IMAGE_SEARCH_CACHE_TTL_SECONDS = 3600
+IMAGE_SEARCH_CACHE_MAX_ENTRIES = 1024
+_search_cache: AsyncTTLCache[list[str]] = AsyncTTLCache(
+    IMAGE_SEARCH_CACHE_TTL_SECONDS, IMAGE_SEARCH_CACHE_MAX_ENTRIES, copy=list
+)
+
 
 async def search_serper(
     query: str,
@@ -27,19 +35,21 @@ async def search_serper(
 ) -> list[str]:
     """Search the serper API for images based on the query.
 
+    Results are cached per normalized query for `IMAGE_SEARCH_CACHE_TTL_SECONDS`.
+
     Args:
         query: The query to search for.
         num_results: The number of results to return.
         recency: The recency of the search.
         location: The location of the web search.
         client: httpx AsyncClient to use for the search.
-        timeout: httpx Timeout for the search.
+        timeout: httpx Timeout for the search, defaults to `DEFAULT_SEARCH_TIMEOUT`.
 
     Returns:
         list of image urls.
 
     """
-    logger.info(f"Searching for images from query: {query}")
+    logger.info("Searching for images from query: %s", query)
     url = "https://google.serper.dev/images"
     api_key = os.environ.get("SERPER_API_KEY")
     headers = {
@@ -63,19 +73,26 @@ async def search_serper(
         "tbs": f"qdr:{time_range}",
         "gl": location
     }
-    async with semaphore:
-        if client is None:
-            async with httpx.AsyncClient() as client:
+    if timeout is None:
+        timeout = DEFAULT_SEARCH_TIMEOUT
+
+    async def search() -> list[str]:
+        async with semaphore:
+            if client is None:
+                async with httpx.AsyncClient() as new_client:
+                    response = await new_client.post(
+                        url, headers=headers, json=payload, timeout=timeout
+                    )
+            else:
                 response = await client.post(
                     url, headers=headers, json=payload, timeout=timeout
                 )
-        else:
-            response = await client.post(
-                url, headers=headers, json=payload, timeout=timeout
-            )
 
-    json_response = response.json()
-    return [item["imageUrl"] for item in json_response["images"]]
+        json_response = response.json()
+        return [item["imageUrl"] for item in json_response["images"]]
+
+    key = ("serper", query.strip().lower(), num_results, recency, location)
+    return await _search_cache.get_or_run(key, search)
 
 
 async def search_linkup(
@@ -87,18 +104,20 @@ async def search_linkup(
 ) -> list[str]:
     """Search for a query using the LinkUp API.
 
+    Results are cached per normalized query for `IMAGE_SEARCH_CACHE_TTL_SECONDS`.
+
     Args:
         query: The query to search for.
         num_results: The number of results to return.
         recency: The recency of the search.
         client: httpx AsyncClient to use for the search.
-        timeout: httpx Timeout for the search.
+        timeout: httpx Timeout for the search, defaults to `DEFAULT_SEARCH_TIMEOUT`.
 
     Returns:
         return a list of image urls.
 
     """
-    logger.info(f"Searching for images from query: {query}")
+    logger.info("Searching for images from query: %s", query)
     url = "https://api.linkup.so/v1/search"
     api_key = os.environ.get("LINKUP_API_KEY")
     headers = {
@@ -118,19 +137,26 @@ async def search_linkup(
         from_date = get_from_date(recency).isoformat()
         data["fromDate"] = from_date
 
-    async with semaphore:
-        if client is None:
-            async with httpx.AsyncClient() as client:
+    if timeout is None:
+        timeout = DEFAULT_SEARCH_TIMEOUT
+
+    async def search() -> list[str]:
+        async with semaphore:
+            if client is None:
+                async with httpx.AsyncClient() as new_client:
+                    response = await new_client.post(
+                        url, headers=headers, json=data, timeout=timeout
+                    )
+            else:
                 response = await client.post(
                     url, headers=headers, json=data, timeout=timeout
                 )
-        else:
-            response = await client.post(
-                url, headers=headers, json=data, timeout=timeout
-            )
 
-    json_response = response.json()
-    results = json_response.get("results", [])
-    urls = [result.get("url") for result in results if result.get("type") == "image"]
+        json_response = response.json()
+        results = json_response.get("results", [])
+        urls = [result.get("url") for result in results if result.get("type") == "image"]
+
+        return urls[:num_results]
 
-    return urls[:num_results]
+    key = ("linkup", query.strip().lower(), num_results, recency)
+    return await _search_cache.get_or_run(key, search)
@@ -4,8 +4,11 @@ import asyncio
 from functools import wraps
 
 
-def async_retry(retries=3, delay_ms=200, exceptions=(Exception,)):
-    """Asynchronous retry decorator."""
+def async_retry(retries=3, delay_ms=200, exceptions=(Exception,), sleep=asyncio.sleep):
+    """Asynchronous retry decorator.
+
+    `sleep` is the coroutine awaited between attempts; tests can inject a no-op.
+    """
     delay = delay_ms / 1000.0
 
     def decorator(func):
@@ -18,7 +21,7 @@ def async_retry(retries=3, delay_ms=200, exceptions=(Exception,)):
                 except exceptions as e:
                     last_err = e
                     if attempt < retries:
-                        await asyncio.sleep(delay)
+                        await sleep(delay)
                     else:
                         raise last_err
         return wrapper
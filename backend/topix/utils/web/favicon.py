@@ -11,6 +11,8 @@ import httpx
 from pydantic import BaseModel, HttpUrl
 from selectolax.parser import HTMLParser
 
+_ICON_SIZES_RE = re.compile(r"(\d+)x(\d+)", re.I)
+
 
 class MetaImages(BaseModel):
     """Favicon + cover image fetched from a webpage."""
@@ -50,7 +52,7 @@ def _score_icon(href: str, sizes: str | None, icon_type: str | None) -> float:
         score += 3
     if "svg" in type_lower:
         score += 2
-    size_match = re.search(r"(\d+)x(\d+)", sizes or "", re.I)
+    size_match = _ICON_SIZES_RE.search(sizes or "")
     if size_match:
         min_side = min(int(size_match.group(1)), int(size_match.group(2)))
         score += min_side / 64
@@ -170,52 +172,73 @@ async def fetch_meta_images(  # noqa: C901
             await client.aclose()
 
 
+def create_meta_images_client(timeout: float = 0.5) -> httpx.AsyncClient:
+    """Create an HTTP/2 client for meta image fetches, meant to be kept and reused.
+
+    Callers that fetch meta images repeatedly should hold on to one client and
+    pass it to `fetch_meta_images_batch` so TLS sessions and keep-alive
+    connections survive across batches. The caller owns the client and must
+    close it with `aclose()`.
+    """
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=httpx.Timeout(timeout, connect=min(timeout, 0.3)),
+        http2=True,
+        headers={
+            "User-Agent": "MetaFetcher/3.2 (+httpx-batch)",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate, br",
+        },
+        limits=httpx.Limits(max_keepalive_connections=64),
+    )
+
+
 async def fetch_meta_images_batch(
     urls: Iterable[str],
     timeout: float = 0.5,
     verify_exists: bool = False,
     favicon_only: bool = False,
     concurrency_limit: int = 200,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> dict[str, MetaImages]:
     """Fetch meta images for many URLs concurrently with a shared client.
 
-    Per-URL errors are caught; that URL maps to MetaImages() (all None).
+    If `client` is given it is used as is and left open; otherwise a client is
+    created for this batch only.
+
+    Duplicate URLs are fetched once. Per-URL errors are caught; that URL maps
+    to MetaImages() (all None).
     """
-    headers = {
-        "User-Agent": "MetaFetcher/3.2 (+httpx-batch)",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br",
-    }
     results: dict[str, MetaImages] = {}
     semaphore = asyncio.Semaphore(concurrency_limit)
 
-    async with httpx.AsyncClient(
-        follow_redirects=True,
-        timeout=httpx.Timeout(timeout, connect=min(timeout, 0.3)),
-        http2=True,
-        headers=headers,
-    ) as shared_client:
-
-        async def process_url(target_url: str) -> None:
-            async with semaphore:
-                try:
-                    # Local precheck avoids blocking DNS
-                    parsed = urlparse(target_url)
-                    if parsed.scheme not in {"http", "https"} or _is_private_literal_ip(parsed.hostname or ""):
-                        results[target_url] = MetaImages()
-                        return
-
-                    results[target_url] = await fetch_meta_images(
-                        target_url,
-                        timeout=timeout,
-                        verify_exists=verify_exists,
-                        favicon_only=favicon_only,
-                        client=shared_client,
-                    )
-                except Exception:
+    owns_client = client is None
+    shared_client = client or create_meta_images_client(timeout)
+
+    async def process_url(target_url: str) -> None:
+        async with semaphore:
+            try:
+                # Local precheck avoids blocking DNS
+                parsed = urlparse(target_url)
+                if parsed.scheme not in {"http", "https"} or _is_private_literal_ip(parsed.hostname or ""):
                     results[target_url] = MetaImages()
+                    return
+
+                results[target_url] = await fetch_meta_images(
+                    target_url,
+                    timeout=timeout,
+                    verify_exists=verify_exists,
+                    favicon_only=favicon_only,
+                    client=shared_client,
+                )
+            except Exception:
+                results[target_url] = MetaImages()
 
+    try:
         # Launch all tasks concurrently
-        await asyncio.gather(*(process_url(target_url) for target_url in urls))
+        await asyncio.gather(*(process_url(target_url) for target_url in dict.fromkeys(urls)))
+    finally:
+        if owns_client:
+            await shared_client.aclose()
 
     return results